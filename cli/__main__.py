@@ -1,67 +1,97 @@
 """CLI entry point."""
 
+import functools
+import importlib
+import sys
+from typing import Callable
+
 from . import click_compat as click
-from cli.commands.init import initCommand
-from cli.commands.migrate import migrateCommand
-from cli.commands.generate import generateCommand
-from cli.commands.reflect import reflectCommand
-from cli.commands.start import startCommand
-
-# Import populate-test-database command (optional, may not be available in all installations)
-populate_test_database = None
-try:
-    import sys
-    import importlib.util
-    from pathlib import Path
-
-    # Add project root to path if scripts directory exists
-    project_root = Path(__file__).parent.parent
-    scripts_dir = project_root / "scripts" / "populate-test-database"
-    cli_file = scripts_dir / "cli.py"
-
-    if cli_file.exists():
-        # Add scripts parent to path for relative imports
-        if str(scripts_dir.parent) not in sys.path:
-            sys.path.insert(0, str(scripts_dir.parent))
-        # Load module using importlib to handle hyphenated directory
-        spec = importlib.util.spec_from_file_location(
-            "populate_test_database_cli", cli_file
-        )
-        if spec and spec.loader:
-            # Create a mock module for the parent to enable relative imports
-            import types
-
-            populate_test_database_module = types.ModuleType("populate_test_database")
-            populate_test_database_module.__path__ = [str(scripts_dir)]
-            sys.modules["populate_test_database"] = populate_test_database_module
-
-            # Load the CLI module
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            populate_test_database = getattr(module, "populate_test_database", None)
-except Exception as e:
-    # Silently fail if command is not available
-    # Uncomment for debugging:
-    # import traceback
-    # traceback.print_exc()
-    populate_test_database = None
+
+_VERSION_FLAGS = ("--version", "-v")
+_HELP_FLAGS = ("--help", "-h")
+
+
+def _commandLoader(moduleName: str, attrName: str) -> Callable:
+    """Build a loader that imports a command module only when it is invoked.
+
+    Args:
+        moduleName: Module name under cli.commands
+        attrName: Name of the command object in that module
+
+    Returns:
+        Callable returning the command object
+    """
+    return lambda: getattr(importlib.import_module(f"cli.commands.{moduleName}"), attrName)
+
+
+@functools.lru_cache(maxsize=1)
+def _loadPopulateTestDatabase() -> object | None:
+    """Import the populate-test-database command if it is available.
+
+    Only runs when the command is invoked, so other commands skip importing
+    it. The result is cached so in-process callers pay for the import once.
+
+    Returns:
+        Command object, or None if the scripts package is not installed
+    """
+    # Optional, may not be available in all installations
+    try:
+        from scripts.populate_test_database.cli import populate_test_database
+    except ImportError:
+        return None
+    return populate_test_database
+
+
+# Command modules are imported lazily so each invocation only loads the one it runs
+_COMMAND_LOADERS: dict[str, Callable] = {
+    "init": _commandLoader("init", "initCommand"),
+    "migrate": _commandLoader("migrate", "migrateCommand"),
+    "generate": _commandLoader("generate", "generateCommand"),
+    "reflect": _commandLoader("reflect", "reflectCommand"),
+    "start": _commandLoader("start", "startCommand"),
+    "populate-test-database": _loadPopulateTestDatabase,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _version() -> str:
+    """Get the installed Pylight version.
+
+    Returns:
+        Version string, or "unknown" when running from a source checkout
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("pylight")
+    except PackageNotFoundError:
+        return "unknown"
 
 
 @click.group()
-def main() -> None:
+def pylight() -> None:
     """Pylight CLI - Next-generation Python API framework."""
     pass
 
 
-main.add_command(initCommand)
-main.add_command(migrateCommand)
-main.add_command(generateCommand)
-main.add_command(reflectCommand)
-main.add_command(startCommand)
+for _name, _loader in _COMMAND_LOADERS.items():
+    pylight.add_lazy_command(_name, _loader)
+
+
+def main() -> None:
+    """Run the Pylight CLI.
+
+    --version and --help are answered before any command module is imported.
+    """
+    firstArg = sys.argv[1:2]
+    if firstArg and firstArg[0] in _VERSION_FLAGS:
+        click.echo(f"pylight {_version()}")
+        return
+    if not firstArg or firstArg[0] in _HELP_FLAGS:
+        pylight._showHelp()
+        return
 
-# Add populate-test-database command if available
-if populate_test_database is not None:
-    main.add_command(populate_test_database)
+    pylight()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 """Click-compatible CLI framework using Python standard library."""
 
-import argparse
 import sys
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    import argparse
 
 
 class Abort(Exception):
@@ -50,22 +52,159 @@ class Choice:
         return value
 
 
+def _normalizeBool(kwargs: dict[str, Any]) -> None:
+    """Turn a boolean option into an argparse flag.
+
+    Args:
+        kwargs: Option parameters, modified in place
+    """
+    kwargs.pop("type", None)
+    kwargs["action"] = "store_true"
+    kwargs.setdefault("default", False)
+
+
+# Option types that need their parameters rewritten for argparse
+_TYPE_NORMALIZERS: dict[Any, Callable[[dict[str, Any]], None]] = {
+    bool: _normalizeBool,
+}
+
+
+def _optionKwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Translate click-style option parameters into argparse parameters.
+
+    Args:
+        kwargs: Option parameters as given to the option decorator
+
+    Returns:
+        Parameters ready for ArgumentParser.add_argument
+    """
+    kwargs = kwargs.copy()
+
+    optionType = kwargs.get("type", str)
+    normalizer = _TYPE_NORMALIZERS.get(optionType)
+    if normalizer is not None:
+        normalizer(kwargs)
+    elif isinstance(optionType, Choice):
+        kwargs["choices"] = optionType.choices
+        kwargs.pop("type", None)
+
+    if "default" in kwargs and kwargs.get("required", False):
+        kwargs.pop("default", None)
+
+    return kwargs
+
+
+def _argumentKwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Translate click-style argument parameters into argparse parameters.
+
+    Args:
+        kwargs: Argument parameters as given to the argument decorator
+
+    Returns:
+        Parameters ready for ArgumentParser.add_argument
+    """
+    kwargs = kwargs.copy()
+
+    argType = kwargs.get("type", str)
+    if isinstance(argType, Choice):
+        kwargs["choices"] = argType.choices
+        kwargs.pop("type", None)
+
+    if not kwargs.pop("required", True):
+        kwargs.setdefault("nargs", "?")
+
+    return kwargs
+
+
+def _optionDest(flags: tuple[str, ...], kwargs: dict[str, Any]) -> str:
+    """Get the destination name argparse uses for an option.
+
+    Args:
+        flags: Option flags
+        kwargs: Option parameters
+
+    Returns:
+        Destination name (e.g. "output_dir" for "--output-dir")
+    """
+    if "dest" in kwargs:
+        return kwargs["dest"]
+    longFlags = [flag for flag in flags if flag.startswith("--")]
+    return (longFlags or list(flags))[0].lstrip("-").replace("-", "_")
+
+
+def _paramName(dest: str) -> str:
+    """Convert a snake_case destination name to the handler's camelCase parameter name.
+
+    Args:
+        dest: Destination name (e.g. "output_dir")
+
+    Returns:
+        Parameter name (e.g. "outputDir")
+    """
+    head, *rest = dest.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+def _convertValue(kwargs: dict[str, Any], value: str) -> Any:
+    """Apply an option or argument's type and choices to a raw value.
+
+    Args:
+        kwargs: argparse-ready parameters
+        value: Raw command line value
+
+    Returns:
+        Converted value
+
+    Raises:
+        ValueError: If the value cannot be converted or is not a valid choice
+    """
+    converted = kwargs.get("type", str)(value)
+    if "choices" in kwargs and converted not in kwargs["choices"]:
+        raise ValueError(f"Invalid choice: {converted}")
+    return converted
+
+
 class _Command:
     """Represents a CLI command."""
 
-    def __init__(self, name: str, func: Callable, helpText: str | None = None):
+    __slots__ = (
+        "name",
+        "func",
+        "helpText",
+        "fastParse",
+        "options",
+        "arguments",
+        "argparseOptions",
+        "argparseArguments",
+        "optionSpecs",
+        "paramNames",
+    )
+
+    def __init__(
+        self, name: str, func: Callable, helpText: str | None = None, fastParse: bool = False
+    ):
         """Initialize command.
 
         Args:
             name: Command name
             func: Command handler function
             helpText: Command help text
+            fastParse: Parse arguments without argparse when possible; meant for
+                commands with one or two plain options and positionals
         """
         self.name = name
         self.func = func
         self.helpText = helpText or func.__doc__ or ""
+        self.fastParse = fastParse
         self.options: list[dict[str, Any]] = []
         self.arguments: list[dict[str, Any]] = []
+        # argparse-ready (flags/name, kwargs), normalized once at registration
+        self.argparseOptions: list[tuple[tuple[str, ...], dict[str, Any]]] = []
+        self.argparseArguments: list[tuple[str, dict[str, Any]]] = []
+        # Flag -> (destination, kwargs), used by the fast parser
+        self.optionSpecs: dict[str, tuple[str, dict[str, Any]]] = {}
+        # Destination name -> handler parameter name
+        self.paramNames: dict[str, str] = {}
 
     def addOption(self, *flags: str, **kwargs: Any) -> None:
         """Add option to command.
@@ -75,6 +214,13 @@ class _Command:
             **kwargs: Option parameters
         """
         self.options.append({"flags": flags, "kwargs": kwargs})
+        argparseKwargs = _optionKwargs(kwargs)
+        self.argparseOptions.append((flags, argparseKwargs))
+
+        dest = _optionDest(flags, kwargs)
+        for flag in flags:
+            self.optionSpecs[flag] = (dest, argparseKwargs)
+        self.paramNames[dest] = _paramName(dest)
 
     def addArgument(self, name: str, **kwargs: Any) -> None:
         """Add argument to command.
@@ -84,6 +230,68 @@ class _Command:
             **kwargs: Argument parameters
         """
         self.arguments.append({"name": name, "kwargs": kwargs})
+        self.argparseArguments.append((name, _argumentKwargs(kwargs)))
+        self.paramNames[name] = _paramName(name)
+
+    def parseFast(self, args: list[str]) -> dict[str, Any] | None:
+        """Parse command line arguments without building an argparse parser.
+
+        Handles positionals, "--flag value", "--flag=value" and boolean flags.
+        Anything else (help, unknown flags, missing values, invalid choices)
+        is left to argparse so users get its usage and error messages.
+
+        Args:
+            args: Command line arguments
+
+        Returns:
+            Parsed values keyed by destination name, or None to fall back to argparse
+        """
+        values: dict[str, Any] = {}
+        for flags, kwargs in self.argparseOptions:
+            values[_optionDest(flags, kwargs)] = kwargs.get("default")
+
+        seen: set[str] = set()
+        positionals: list[str] = []
+        remaining = iter(args)
+        for arg in remaining:
+            if not arg.startswith("-"):
+                positionals.append(arg)
+                continue
+
+            flag, hasValue, value = arg.partition("=")
+            spec = self.optionSpecs.get(flag)
+            if spec is None:
+                return None
+            dest, kwargs = spec
+
+            if kwargs.get("action") == "store_true":
+                if hasValue:
+                    return None
+                values[dest] = True
+            else:
+                if not hasValue:
+                    value = next(remaining, None)
+                    if value is None:
+                        return None
+                try:
+                    values[dest] = _convertValue(kwargs, value)
+                except (TypeError, ValueError):
+                    return None
+            seen.add(dest)
+
+        for flags, kwargs in self.argparseOptions:
+            if kwargs.get("required") and _optionDest(flags, kwargs) not in seen:
+                return None
+
+        if len(positionals) != len(self.argparseArguments):
+            return None
+        for (argName, argKwargs), value in zip(self.argparseArguments, positionals):
+            try:
+                values[argName] = _convertValue(argKwargs, value)
+            except (TypeError, ValueError):
+                return None
+
+        return values
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         """Execute command."""
@@ -93,6 +301,17 @@ class _Command:
 class _Group:
     """Represents a CLI command group."""
 
+    __slots__ = (
+        "name",
+        "func",
+        "helpText",
+        "commands",
+        "lazyCommands",
+        "options",
+        "arguments",
+        "_parserCache",
+    )
+
     def __init__(self, name: str | None, func: Callable, helpText: str | None = None):
         """Initialize group.
 
@@ -105,8 +324,10 @@ class _Group:
         self.func = func
         self.helpText = helpText or func.__doc__ or ""
         self.commands: dict[str, _Command | _Group] = {}
+        self.lazyCommands: dict[str, Callable[[], _Command | _Group]] = {}
         self.options: list[dict[str, Any]] = []
         self.arguments: list[dict[str, Any]] = []
+        self._parserCache: dict[str, "argparse.ArgumentParser"] = {}
 
     def addOption(self, *flags: str, **kwargs: Any) -> None:
         """Add option to group.
@@ -134,6 +355,32 @@ class _Group:
         """
         self.commands[command.name] = command
 
+    def add_lazy_command(self, name: str, loader: Callable[[], "_Command | _Group"]) -> None:
+        """Register a command whose module is only imported when it is invoked.
+
+        Args:
+            name: Command name used for dispatch and help listing
+            loader: Callable returning the command or group (or a native
+                click command) on first use, or None if the command is
+                unavailable in this installation
+        """
+        self.lazyCommands[name] = loader
+
+    def _resolveCommand(self, name: str) -> "_Command | _Group | None":
+        """Look up a command, materializing it from its lazy loader if needed.
+
+        Args:
+            name: Command name
+
+        Returns:
+            Command or group, or None if no command is registered under name
+        """
+        if name not in self.commands and name in self.lazyCommands:
+            command = self.lazyCommands.pop(name)()
+            if command is not None:
+                self.add_command(command)
+        return self.commands.get(name)
+
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         """Execute group (process CLI arguments)."""
         if args:
@@ -146,12 +393,15 @@ class _Group:
             return
 
         commandName = args[0]
-        if commandName in self.commands:
-            cmd = self.commands[commandName]
+        cmd = self._resolveCommand(commandName)
+        if cmd is not None:
             if isinstance(cmd, _Group):
                 cmd(*args[1:])
-            else:
+            elif isinstance(cmd, _Command):
                 self._executeCommand(cmd, args[1:])
+            else:
+                # A native click command (populate-test-database) parses its own arguments
+                cmd.main(args=list(args[1:]), prog_name=commandName)
         else:
             echo(f"Error: Unknown command '{commandName}'", err=True)
             self._showHelp()
@@ -164,60 +414,52 @@ class _Group:
             command: Command to execute
             args: Command line arguments
         """
-        parser = argparse.ArgumentParser(prog=command.name, description=command.helpText)
+        parsed = command.parseFast(args) if command.fastParse else None
+        if parsed is None:
+            parser = self._parserCache.get(command.name)
+            if parser is None:
+                parser = self._buildParser(command)
+                self._parserCache[command.name] = parser
+            parsed = vars(parser.parse_args(args))
 
-        for option in command.options:
-            flags = option["flags"]
-            kwargs = option["kwargs"].copy()
+        kwargs = {command.paramNames.get(dest, dest): value for dest, value in parsed.items()}
 
-            optionType = kwargs.get("type", str)
-            if optionType == bool:
-                kwargs["action"] = "store_true"
-                if "default" not in kwargs:
-                    kwargs["default"] = False
-                kwargs.pop("type", None)
-            elif isinstance(optionType, Choice):
-                kwargs["choices"] = optionType.choices
-                kwargs.pop("type", None)
+        try:
+            command.func(**kwargs)
+        except Abort:
+            sys.exit(1)
+        except Exception as e:
+            echo(f"Error: {e}", err=True)
+            sys.exit(1)
 
-            if "default" in kwargs and kwargs.get("required", False):
-                kwargs.pop("default", None)
+    def _buildParser(self, command: _Command) -> "argparse.ArgumentParser":
+        """Build the argument parser for a command.
 
-            parser.add_argument(*flags, **kwargs)
+        Args:
+            command: Command to build the parser for
 
-        for arg in command.arguments:
-            argName = arg["name"]
-            argKwargs = arg["kwargs"].copy()
+        Returns:
+            Configured argument parser
+        """
+        import argparse
 
-            argType = argKwargs.get("type", str)
-            if isinstance(argType, Choice):
-                argKwargs["choices"] = argType.choices
-                argKwargs.pop("type", None)
+        parser = argparse.ArgumentParser(prog=command.name, description=command.helpText)
 
-            if "required" in argKwargs:
-                argKwargs.pop("required")
+        for flags, kwargs in command.argparseOptions:
+            parser.add_argument(*flags, **kwargs)
 
+        for argName, argKwargs in command.argparseArguments:
             parser.add_argument(argName, **argKwargs)
 
-        parsed = parser.parse_args(args)
-        kwargs = vars(parsed)
-
-        try:
-            command.func(**kwargs)
-        except Abort:
-            sys.exit(1)
-        except Exception as e:
-            echo(f"Error: {e}", err=True)
-            sys.exit(1)
+        return parser
 
     def _showHelp(self) -> None:
         """Show help message."""
-        if self.helpText:
-            echo(self.helpText)
-        echo("")
-        echo("Available commands:")
-        for name in sorted(self.commands.keys()):
-            echo(f"  {name}")
+        lines = [self.helpText] if self.helpText else []
+        lines.append("")
+        lines.append("Available commands:")
+        lines.extend(f"  {name}" for name in sorted(self.commands.keys() | self.lazyCommands.keys()))
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def command(name: str | None = None, **kwargs: Any) -> Callable:
@@ -225,23 +467,25 @@ def command(name: str | None = None, **kwargs: Any) -> Callable:
 
     Args:
         name: Command name (default: function name)
-        **kwargs: Additional command parameters (help, etc.)
+        **kwargs: Additional command parameters (help, fast_parse, etc.)
 
     Returns:
         Decorator function
     """
 
+    helpText = kwargs.get("help")
+    fastParse = kwargs.get("fast_parse", False)
+
     def decorator(func: Callable) -> _Command:
         commandName = name or func.__name__
-        cmd = _Command(commandName, func, kwargs.get("help"))
+        cmd = _Command(commandName, func, helpText, fastParse)
 
-        if hasattr(func, "_click_options"):
-            for opt in func._click_options:
-                cmd.addOption(*opt["flags"], **opt["kwargs"])
+        # Decorators run bottom-up, so the lists are in reverse declaration order
+        for opt in reversed(func.__dict__.get("_click_options", ())):
+            cmd.addOption(*opt["flags"], **opt["kwargs"])
 
-        if hasattr(func, "_click_arguments"):
-            for arg in func._click_arguments:
-                cmd.addArgument(arg["name"], **arg["kwargs"])
+        for arg in reversed(func.__dict__.get("_click_arguments", ())):
+            cmd.addArgument(arg["name"], **arg["kwargs"])
 
         return cmd
 
@@ -260,10 +504,7 @@ def option(*flags: str, **kwargs: Any) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
-        if not hasattr(func, "_click_options"):
-            func._click_options = []
-
-        func._click_options.append({"flags": flags, "kwargs": kwargs})
+        func.__dict__.setdefault("_click_options", []).append({"flags": flags, "kwargs": kwargs})
         return func
 
     return decorator
@@ -281,10 +522,7 @@ def argument(name: str, **kwargs: Any) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
-        if not hasattr(func, "_click_arguments"):
-            func._click_arguments = []
-
-        func._click_arguments.append({"name": name, "kwargs": kwargs})
+        func.__dict__.setdefault("_click_arguments", []).append({"name": name, "kwargs": kwargs})
         return func
 
     return decorator
@@ -301,17 +539,18 @@ def group(name: str | None = None, **kwargs: Any) -> Callable:
         Decorator function
     """
 
+    helpText = kwargs.get("help")
+
     def decorator(func: Callable) -> _Group:
         groupName = name or func.__name__
-        grp = _Group(groupName, func, kwargs.get("help"))
+        grp = _Group(groupName, func, helpText)
 
-        if hasattr(func, "_click_options"):
-            for opt in func._click_options:
-                grp.addOption(*opt["flags"], **opt["kwargs"])
+        # Decorators run bottom-up, so the lists are in reverse declaration order
+        for opt in reversed(func.__dict__.get("_click_options", ())):
+            grp.addOption(*opt["flags"], **opt["kwargs"])
 
-        if hasattr(func, "_click_arguments"):
-            for arg in func._click_arguments:
-                grp.addArgument(arg["name"], **arg["kwargs"])
+        for arg in reversed(func.__dict__.get("_click_arguments", ())):
+            grp.addArgument(arg["name"], **arg["kwargs"])
 
         func._command_group = grp
         return grp
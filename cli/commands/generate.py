@@ -3,8 +3,23 @@
 from pathlib import Path
 from cli import click_compat as click
 
+_ENDPOINT_TEMPLATE = '''"""Generated endpoint for {model}."""
 
-@click.command("generate")
+from src.presentation.rest.get_handler import getHandler
+from src.presentation.rest.post_handler import postHandler
+from src.presentation.rest.put_handler import putHandler
+from src.presentation.rest.delete_handler import deleteHandler
+from src.models.{modelLower} import {model}
+
+# Customize these handlers as needed
+get_{modelLower}_handler = getHandler({model})
+post_{modelLower}_handler = postHandler({model})
+put_{modelLower}_handler = putHandler({model})
+delete_{modelLower}_handler = deleteHandler({model})
+'''
+
+
+@click.command("generate", fast_parse=True)
 @click.argument("model_name", type=str)
 @click.option("--output-dir", type=str, default="endpoints", help="Output directory for generated files")
 def generateCommand(modelName: str, outputDir: str) -> None:
@@ -17,24 +32,9 @@ def generateCommand(modelName: str, outputDir: str) -> None:
     outputPath = Path(outputDir)
     outputPath.mkdir(parents=True, exist_ok=True)
 
-    endpointFile = outputPath / f"{modelName.lower()}_endpoint.py"
-    endpointFile.write_text(
-        f'''"""Generated endpoint for {modelName}."""
-
-from src.presentation.rest.get_handler import getHandler
-from src.presentation.rest.post_handler import postHandler
-from src.presentation.rest.put_handler import putHandler
-from src.presentation.rest.delete_handler import deleteHandler
-from src.models.{modelName.lower()} import {modelName}
-
-# Customize these handlers as needed
-get_{modelName.lower()}_handler = getHandler({modelName})
-post_{modelName.lower()}_handler = postHandler({modelName})
-put_{modelName.lower()}_handler = putHandler({modelName})
-delete_{modelName.lower()}_handler = deleteHandler({modelName})
-'''
-    )
+    modelLower = modelName.lower()
+    endpointFile = outputPath / f"{modelLower}_endpoint.py"
+    endpointFile.write_text(_ENDPOINT_TEMPLATE.format_map({"model": modelName, "modelLower": modelLower}))
 
     click.echo(f"✓ Generated endpoint file: {endpointFile}")
     click.echo(f"  Customize {endpointFile} as needed")
-
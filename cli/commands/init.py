@@ -1,11 +1,12 @@
 """CLI init command to scaffold new projects."""
 
+import os
 import shutil
 from pathlib import Path
 from cli import click_compat as click
 
 
-@click.command("init")
+@click.command("init", fast_parse=True)
 @click.argument("project_name", type=str)
 def initCommand(projectName: str) -> None:
     """Initialize a new Pylight project.
@@ -23,12 +24,11 @@ def initCommand(projectName: str) -> None:
         templateDir = Path(__file__).parent.parent / "templates" / "project"
 
         if templateDir.exists():
-            for item in templateDir.rglob("*"):
-                if item.is_file():
-                    relativePath = item.relative_to(templateDir)
-                    targetPath = projectPath / relativePath
-                    targetPath.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, targetPath)
+            for root, _, files in os.walk(templateDir):
+                targetDir = os.path.join(projectPath, os.path.relpath(root, templateDir))
+                os.makedirs(targetDir, exist_ok=True)
+                for fileName in files:
+                    shutil.copyfile(os.path.join(root, fileName), os.path.join(targetDir, fileName))
 
         click.echo(f"✓ Created project '{projectName}'")
         click.echo(f"  cd {projectName}")
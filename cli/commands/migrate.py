@@ -1,11 +1,44 @@
 """CLI migrate command for database schema management."""
 
+from typing import Any, Callable
+
 from cli import click_compat as click
-from src.infrastructure.database.migrations import MigrationManager
+
+
+def _createMigration(migrationManager: Any, name: str | None) -> str:
+    """Create a migration named after the given message."""
+    migrationManager.createMigration(name)
+    return f"✓ Created migration: {name}"
+
+
+def _upgrade(migrationManager: Any, name: str | None) -> str:
+    """Upgrade the database to head."""
+    migrationManager.upgrade()
+    return "✓ Database upgraded"
+
+
+def _downgrade(migrationManager: Any, name: str | None) -> str:
+    """Downgrade the database to the given revision."""
+    migrationManager.downgrade(name)
+    return f"✓ Database downgraded to: {name}"
+
+
+# Each action runs against a MigrationManager and returns its success message
+_MIGRATE_ACTIONS: dict[str, Callable[[Any, str | None], str]] = {
+    "create": _createMigration,
+    "upgrade": _upgrade,
+    "downgrade": _downgrade,
+}
+
+# Actions that cannot run without a name, with the error shown when it is missing
+_NAME_REQUIRED = {
+    "create": "Migration name required for 'create' action",
+    "downgrade": "Revision required for 'downgrade' action",
+}
 
 
 @click.command("migrate")
-@click.argument("action", type=click.Choice(["create", "upgrade", "downgrade"]))
+@click.argument("action", type=click.Choice(list(_MIGRATE_ACTIONS)))
 @click.argument("name", required=False, type=str)
 @click.option("--database-url", type=str, help="Database connection URL")
 def migrateCommand(action: str, name: str | None, databaseUrl: str | None) -> None:
@@ -13,31 +46,22 @@ def migrateCommand(action: str, name: str | None, databaseUrl: str | None) -> No
 
     Args:
         action: Migration action (create, upgrade, downgrade)
-        name: Migration name (required for create)
+        name: Migration name or revision (required for create and downgrade)
         databaseUrl: Database connection URL
     """
-    if action == "create" and not name:
-        click.echo("Error: Migration name required for 'create' action", err=True)
+    if not name and action in _NAME_REQUIRED:
+        click.echo(f"Error: {_NAME_REQUIRED[action]}", err=True)
         return
 
     if not databaseUrl:
         click.echo("Error: --database-url required", err=True)
         return
 
+    from src.infrastructure.database.migrations import MigrationManager
+
     try:
         migrationManager = MigrationManager(databaseUrl)
-        if action == "create":
-            migrationManager.createMigration(name)
-            click.echo(f"✓ Created migration: {name}")
-        elif action == "upgrade":
-            migrationManager.upgrade()
-            click.echo("✓ Database upgraded")
-        elif action == "downgrade":
-            if not name:
-                click.echo("Error: Revision required for 'downgrade' action", err=True)
-                return
-            migrationManager.downgrade(name)
-            click.echo(f"✓ Database downgraded to: {name}")
+        click.echo(_MIGRATE_ACTIONS[action](migrationManager, name))
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
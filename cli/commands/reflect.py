@@ -3,9 +3,6 @@
 from pathlib import Path
 from cli import click_compat as click
 
-from src.infrastructure.database.reflection import DatabaseReflection
-from src.infrastructure.database.model_generator import ModelGenerator
-
 
 @click.command("reflect")
 @click.option("--database-url", type=str, required=True, help="Database connection URL")
@@ -17,6 +14,9 @@ def reflectCommand(databaseUrl: str, outputDir: str) -> None:
         databaseUrl: Database connection URL
         outputDir: Directory to output generated model files
     """
+    from src.infrastructure.database.reflection import DatabaseReflection
+    from src.infrastructure.database.model_generator import ModelGenerator
+
     try:
         reflection = DatabaseReflection(databaseUrl)
         tables = reflection.reflectTables()
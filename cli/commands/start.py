@@ -3,9 +3,6 @@
 import os
 from cli import click_compat as click
 
-from src.presentation.app import LightApi
-from src.domain.errors import ConfigurationError, ReflectionError
-
 
 @click.command("start")
 @click.option("--config", type=str, help="Path to YAML configuration file")
@@ -27,9 +24,8 @@ def startCommand(config: str, host: str, port: int) -> None:
         click.echo("  Example: pylight start --config api-config.yaml", err=True)
         raise click.Abort()
 
-    if not os.path.exists(yamlPath):
-        click.echo(f"Error: Configuration file not found: {yamlPath}", err=True)
-        raise click.Abort()
+    from src.presentation.app import LightApi
+    from src.domain.errors import ConfigurationError, ReflectionError
 
     try:
         click.echo(f"Loading configuration from: {yamlPath}")
@@ -0,0 +1,13 @@
+"""Shared declarative base for starter todo-app models."""
+
+# Note: In generated projects, RestEndpoint will be available from pylight package
+# from pylight import RestEndpoint
+# For now, using placeholder - will be replaced during template processing
+from sqlalchemy.ext.declarative import declarative_base
+
+# A single Base keeps all models in one MetaData so cross-model foreign keys resolve
+Base = declarative_base()
+
+
+class RestEndpoint(Base):
+    __abstract__ = True
@@ -5,16 +5,7 @@ from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 
-# Note: In generated projects, RestEndpoint will be available from pylight package
-# from pylight import RestEndpoint
-# For now, using placeholder - will be replaced during template processing
-from sqlalchemy.ext.declarative import declarative_base
-
-Base = declarative_base()
-
-
-class RestEndpoint(Base):
-    __abstract__ = True
+from .base import RestEndpoint
 
 
 class TaskStatus(enum.Enum):
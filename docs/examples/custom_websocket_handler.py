@@ -4,15 +4,18 @@ This example demonstrates how to create and use custom WebSocket handlers
 using the class-based method override pattern.
 """
 
-import json
+import asyncio
+import hmac
+import logging
 import os
 import sys
 
 # Add parent directory to path to import framework
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from typing import Type
+from typing import Optional, Type
 
+import orjson
 from sqlalchemy import Column, Integer, String
 from starlette.websockets import WebSocket
 
@@ -20,6 +23,18 @@ from pylight.domain.entities.rest_endpoint import RestEndpoint
 from pylight.infrastructure.websocket.base import WebSocketHandler
 from pylight.presentation.app import LightApi
 
+try:
+    import ormsgpack
+except ImportError:
+    # Optional: without it every client gets JSON frames
+    ormsgpack = None
+
+
+logger = logging.getLogger(__name__)
+
+# Placeholder token accepted by AuthenticatedHandler
+VALID_TOKEN = b"valid_token_example"
+
 
 # Example 1: Basic Custom Handler
 class BasicCustomHandler(WebSocketHandler):
@@ -32,8 +47,64 @@ class BasicCustomHandler(WebSocketHandler):
         )
 
 
-# Example 2: Handler with Message Parsing
-class MessageParsingHandler(WebSocketHandler):
+# Example 2: Handler with an Outbound Queue
+class QueuedWebSocketHandler(WebSocketHandler):
+    """Handler that writes to the client from a single per-connection task.
+
+    send() only enqueues the message, so callers never wait on a slow client.
+    The writer sends queued messages in order, one frame each, with dicts
+    encoded by orjson. A client that falls max_queued messages behind is
+    disconnected, and nothing is queued once the writer has stopped.
+    """
+
+    max_queued = 1000
+
+    def __init__(self) -> None:
+        """Initialize handler without an outbound queue."""
+        self.queue: Optional[asyncio.Queue] = None
+        self.writer: Optional[asyncio.Task] = None
+
+    async def on_connect(self, websocket: WebSocket, model: Type[RestEndpoint]) -> None:
+        """Start the writer task for this connection."""
+        self.queue = asyncio.Queue(maxsize=self.max_queued)
+        self.writer = asyncio.create_task(self.write_messages(websocket))
+
+    async def on_disconnect(self, websocket: WebSocket, model: Type[RestEndpoint]) -> None:
+        """Stop the writer task for this connection."""
+        if self.writer is not None:
+            self.writer.cancel()
+
+    async def send(self, websocket: WebSocket, message: str | dict) -> None:
+        """Queue a message for the writer task."""
+        if self.queue is None:
+            await super().send(websocket, message)
+            return
+        if self.writer.done():
+            # Nothing would ever drain the queue
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("WebSocket client fell too far behind, disconnecting")
+            self.writer.cancel()
+            await websocket.close(code=1013)
+
+    async def write_messages(self, websocket: WebSocket) -> None:
+        """Send queued messages one frame each until sending fails."""
+        try:
+            while True:
+                message = await self.queue.get()
+                if isinstance(message, dict):
+                    message = orjson.dumps(message).decode()
+                await websocket.send_text(str(message))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"WebSocket writer stopped: {e}", exc_info=True)
+
+
+# Example 3: Handler with Message Parsing
+class MessageParsingHandler(QueuedWebSocketHandler):
     """Handler that parses JSON messages and responds accordingly."""
 
     async def on_message(
@@ -41,7 +112,7 @@ class MessageParsingHandler(WebSocketHandler):
     ) -> None:
         """Parse JSON message and respond based on action."""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             action = data.get("action")
 
             if action == "subscribe":
@@ -60,12 +131,12 @@ class MessageParsingHandler(WebSocketHandler):
 
             # Unknown action
             await self.send(websocket, {"error": "Unknown action", "received": data})
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             await self.send(websocket, {"error": "Invalid JSON"})
 
 
-# Example 3: Handler with Async Operations
-class AsyncOperationHandler(WebSocketHandler):
+# Example 4: Handler with Async Operations
+class AsyncOperationHandler(QueuedWebSocketHandler):
     """Handler that performs async operations (e.g., database queries)."""
 
     async def on_message(
@@ -73,7 +144,7 @@ class AsyncOperationHandler(WebSocketHandler):
     ) -> None:
         """Process message with async operations."""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             product_id = data.get("product_id")
 
             # Simulate async database query
@@ -89,7 +160,7 @@ class AsyncOperationHandler(WebSocketHandler):
             await self.send(websocket, {"error": str(e)})
 
 
-# Example 4: Handler with Authentication
+# Example 5: Handler with Authentication
 class AuthenticatedHandler(WebSocketHandler):
     """Handler that validates authentication on connect."""
 
@@ -105,8 +176,49 @@ class AuthenticatedHandler(WebSocketHandler):
 
     def validate_token(self, token: str) -> bool:
         """Validate authentication token (example implementation)."""
-        # In real usage, validate JWT or session token
-        return token == "valid_token_example"
+        # In real usage, validate a JWT (e.g. jwt.decode with algorithms=["HS256"])
+        # or session token instead; compare_digest avoids leaking timing information
+        return hmac.compare_digest(token.encode(), VALID_TOKEN)
+
+
+# Example 6: Handler with a Binary Wire Format
+class MsgpackInventoryHandler(WebSocketHandler):
+    """Handler that sends binary frames to clients that ask for msgpack.
+
+    Clients connecting with the "msgpack" subprotocol get every dict packed
+    with ormsgpack, so each binary frame decodes as one msgpack value. The
+    framework packs create/update/delete broadcasts for them the same way.
+    Other clients get the usual JSON text frames.
+    """
+
+    subprotocols = ("msgpack",) if ormsgpack is not None else ()
+
+    async def send(self, websocket: WebSocket, message: str | dict) -> None:
+        """Send dicts as msgpack on msgpack connections, JSON otherwise."""
+        if websocket.state.subprotocol == "msgpack" and isinstance(message, dict):
+            await websocket.send_bytes(ormsgpack.packb(message))
+            return
+        await super().send(websocket, message)
+
+    async def on_message(
+        self, websocket: WebSocket, model: Type[RestEndpoint], message: str
+    ) -> None:
+        """Acknowledge a quantity update with the new quantity."""
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            await self.send(websocket, {"error": "Invalid JSON"})
+            return
+
+        try:
+            quantity = int(data.get("quantity", 0))
+        except (AttributeError, TypeError, ValueError):
+            # data is not an object, or its quantity is not a number
+            await self.send(websocket, {"error": "quantity must be an integer"})
+            return
+
+        # In real usage, you would store the new quantity before acknowledging it
+        await self.send(websocket, {"quantity": quantity})
 
 
 # Example Models with Custom Handlers
@@ -136,7 +248,7 @@ class Order(RestEndpoint):
 
 
 class Inventory(RestEndpoint):
-    """Inventory model with async operations handler."""
+    """Inventory model with binary wire format handler."""
 
     __tablename__ = "inventory"
 
@@ -144,7 +256,7 @@ class Inventory(RestEndpoint):
     quantity = Column(Integer)
 
     class Configuration:
-        websocket_class = AsyncOperationHandler
+        websocket_class = MsgpackInventoryHandler
 
 
 # Example Usage
@@ -155,14 +267,15 @@ def main():
     # Register models with custom handlers
     app.register(Product)  # Uses BasicCustomHandler
     app.register(Order)  # Uses MessageParsingHandler
-    app.register(Inventory)  # Uses AsyncOperationHandler
+    app.register(Inventory)  # Uses MsgpackInventoryHandler
 
     print("Starting server with custom WebSocket handlers...")
     print("- Product WebSocket: /ws/products (BasicCustomHandler)")
     print("- Order WebSocket: /ws/orders (MessageParsingHandler)")
-    print("- Inventory WebSocket: /ws/inventory (AsyncOperationHandler)")
+    print("- Inventory WebSocket: /ws/inventory (MsgpackInventoryHandler)")
 
-    app.run(host="localhost", port=8000)
+    # uvloop is installed with uvicorn[standard]; require it instead of falling back
+    app.run(host="localhost", port=8000, loop="uvloop")
 
 
 if __name__ == "__main__":
@@ -1,27 +1,298 @@
 """Database utilities for integration examples."""
 
-from typing import Any, Dict, List, Optional, Tuple
-from sqlalchemy import create_engine, text
+import functools
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import asyncpg
+from sqlalchemy import TextClause, create_engine, make_url, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 
-def create_database_connection(database_url: str) -> Tuple[Engine, sessionmaker]:
+def create_database_connection(
+    database_url: str, pool_size: int = 20, max_overflow: int = 30, pool_recycle: int = 1800
+) -> Tuple[Engine, sessionmaker]:
     """Create database connection and session factory.
 
+    The pool hands out the most recently used connection first and pings it
+    before use, so the examples share a few warm connections with the server
+    and never get one the database has already closed.
+
+    On psycopg2, executemany() calls are batched: INSERTs are sent as
+    multi-row VALUES statements and other statements through execute_batch,
+    so bulk writes through the returned sessions take a few round trips
+    instead of one per row.
+
     Args:
         database_url: Database connection URL
+        pool_size: Number of pooled connections
+        max_overflow: Connections allowed beyond pool_size
+        pool_recycle: Seconds after which a connection is replaced
 
     Returns:
         Tuple of (engine, sessionmaker)
     """
-    engine = create_engine(database_url)
-    Session = sessionmaker(bind=engine)
+    options: Dict[str, Any] = {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": 30,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    }
+    if make_url(database_url).get_driver_name() == "psycopg2":
+        options.update(executemany_mode="values_plus_batch", insertmanyvalues_page_size=1000)
+    engine = create_engine(database_url, **options)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+    return engine, Session
+
+
+def create_async_database_connection(
+    database_url: str, pool_size: int = 25, max_overflow: int = 0
+) -> Tuple[AsyncEngine, async_sessionmaker]:
+    """Create asyncpg-backed database connection and session factory.
+
+    Plain postgresql:// URLs are switched to the asyncpg driver, so queries run
+    on the event loop instead of being handed to a thread pool.
+
+    Args:
+        database_url: Database connection URL
+        pool_size: Number of pooled connections
+        max_overflow: Connections allowed beyond pool_size
+
+    Returns:
+        Tuple of (async engine, async sessionmaker)
+    """
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(database_url, pool_size=pool_size, max_overflow=max_overflow)
+    Session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     return engine, Session
 
 
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _check_identifier(name: str) -> str:
+    """Reject table or column names that are not plain SQL identifiers.
+
+    Names are interpolated into SQL, so anything else could inject SQL.
+
+    Args:
+        name: Table or column name
+
+    Returns:
+        The name, unchanged
+
+    Raises:
+        ValueError: If the name is not a plain identifier
+    """
+    if not _IDENTIFIER.fullmatch(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+# Shared asyncpg pool for the async verify/cleanup helpers, created on first use
+_POOL: Optional[asyncpg.Pool] = None
+
+# asyncpg caches prepared statements by SQL text, so these are formatted once per table
+SQL_VERIFY_BY_ID = "SELECT * FROM {table} WHERE id = $1"
+SQL_CLEANUP_BY_PREFIX = "DELETE FROM {table} WHERE name LIKE $1 ESCAPE '\\'"
+
+
+@functools.lru_cache(maxsize=None)
+def _table_sql(template: str, table_name: str) -> str:
+    """Format a SQL template for a table once and reuse the string.
+
+    Args:
+        template: SQL template with a {table} placeholder
+        table_name: Table name
+
+    Returns:
+        SQL string for the table
+    """
+    return template.format(table=_check_identifier(table_name))
+
+
+async def get_asyncpg_pool(database_url: str) -> asyncpg.Pool:
+    """Get the shared asyncpg pool, creating it on first use.
+
+    Args:
+        database_url: Database connection URL (any SQLAlchemy driver suffix is dropped)
+
+    Returns:
+        asyncpg connection pool
+    """
+    global _POOL
+    if _POOL is None:
+        dsn = re.sub(r"^postgresql\+\w+://", "postgresql://", database_url)
+        _POOL = await asyncpg.create_pool(
+            dsn,
+            min_size=5,
+            max_size=25,
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
+        )
+    return _POOL
+
+
+async def close_asyncpg_pool() -> None:
+    """Close the shared asyncpg pool if it was created."""
+    global _POOL
+    if _POOL is not None:
+        await _POOL.close()
+        _POOL = None
+
+
+async def create_missing_tables(pool: asyncpg.Pool, engine: AsyncEngine, *models: Any) -> List[str]:
+    """Create the tables of the given models that do not exist yet.
+
+    Existence is checked for all tables in one pg_tables query, so the usual
+    case (everything already created) costs a single round trip.
+
+    Args:
+        pool: asyncpg pool from get_asyncpg_pool
+        engine: Async engine used to issue the DDL
+        *models: Model classes whose tables are required
+
+    Returns:
+        Names of the tables that were created
+    """
+    tables = {model.__table__.name: model.__table__ for model in models}
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            "SELECT tablename FROM pg_tables WHERE schemaname = 'public' AND tablename = ANY($1::text[])",
+            list(tables),
+        )
+    existing = {row["tablename"] for row in rows}
+    missing = [table for name, table in tables.items() if name not in existing]
+    if missing:
+        metadata = missing[0].metadata
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all, tables=missing, checkfirst=False)
+    return [table.name for table in missing]
+
+
+def _to_positional(query: str, params: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """Rewrite :name bind parameters as asyncpg $n placeholders.
+
+    Args:
+        query: SQL string using :name parameters
+        params: Bind parameters by name
+
+    Returns:
+        Tuple of (SQL string, positional arguments)
+    """
+    args: List[Any] = []
+
+    def placeholder(match: re.Match) -> str:
+        args.append(params[match.group(1)])
+        return f"${len(args)}"
+
+    return re.sub(r":(\w+)", placeholder, query), args
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix_pattern(prefix: str) -> str:
+    """Build the LIKE pattern matching names that start with prefix.
+
+    LIKE wildcards in the prefix are escaped, so "test_" matches the literal
+    underscore only. A literal prefix lets PostgreSQL answer the LIKE with a
+    range scan on a varchar_pattern_ops index, under any collation.
+
+    Args:
+        prefix: Literal name prefix
+
+    Returns:
+        LIKE pattern for use with ESCAPE '\\'
+    """
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+@functools.lru_cache(maxsize=128)
+def _state_sql(
+    table_name: str,
+    by_id: bool,
+    with_prefix: bool,
+    filter_keys: Tuple[str, ...],
+    columns: Optional[Tuple[str, ...]] = None,
+) -> str:
+    """Build the SELECT used by verify_database_state once per query shape.
+
+    Args:
+        table_name: Table name to query
+        by_id: Whether the query selects a single record by ID
+        with_prefix: Whether to filter on the test prefix
+        filter_keys: Columns of the additional filter criteria
+        columns: Columns to select, or None for all columns
+
+    Returns:
+        SQL string using :name bind parameters
+    """
+    selected = ", ".join(_check_identifier(column) for column in columns) if columns else "*"
+    query = f"SELECT {selected} FROM {_check_identifier(table_name)}"
+    if by_id:
+        return f"{query} WHERE id = :id"
+
+    conditions = ["name LIKE :test_prefix ESCAPE '\\'"] if with_prefix else []
+    conditions += [f"{_check_identifier(key)} = :{key}" for key in filter_keys]
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query
+
+
+@functools.lru_cache(maxsize=128)
+def _text(query: str) -> TextClause:
+    """Parse a SQL string into a text() construct once and reuse it.
+
+    Args:
+        query: SQL string using :name bind parameters
+
+    Returns:
+        TextClause for the query
+    """
+    return text(query)
+
+
+def _build_state_query(
+    table_name: str,
+    record_id: Optional[int],
+    test_prefix: str,
+    filters: Dict[str, Any],
+    columns: Optional[Sequence[str]] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Build the SELECT used by verify_database_state.
+
+    Args:
+        table_name: Table name to query
+        record_id: Optional record ID to query
+        test_prefix: Prefix for test data filtering (used when record_id is None)
+        filters: Additional filter criteria
+        columns: Columns to select, or None for all columns
+
+    Returns:
+        Tuple of (SQL string, bind parameters)
+    """
+    columns = tuple(columns) if columns else None
+    if record_id is not None:
+        return _state_sql(table_name, True, False, (), columns), {"id": record_id}
+
+    params = dict(filters)
+    # Add test prefix filter if name column exists
+    if test_prefix:
+        params["test_prefix"] = _prefix_pattern(test_prefix)
+    return _state_sql(table_name, False, bool(test_prefix), tuple(filters), columns), params
+
+
 def verify_database_state(
-    session: Session, table_name: str, record_id: Optional[int] = None, test_prefix: str = "test_", **filters
+    session: Session,
+    table_name: str,
+    record_id: Optional[int] = None,
+    test_prefix: str = "test_",
+    columns: Optional[Sequence[str]] = None,
+    **filters,
 ) -> Optional[Dict[str, Any]] | List[Dict[str, Any]]:
     """Query database and validate state.
 
@@ -30,41 +301,106 @@ def verify_database_state(
         table_name: Table name to query
         record_id: Optional record ID to query
         test_prefix: Prefix for test data filtering (used when record_id is None)
+        columns: Columns to fetch, or None for all; pass only the ones the caller
+            checks to skip wide columns such as descriptions
         **filters: Additional filter criteria
 
     Returns:
         Record as dictionary or None if not found (when record_id provided),
         or list of records (when record_id is None)
     """
+    query, params = _build_state_query(table_name, record_id, test_prefix, filters, columns)
+    # Repeated lookups reuse the same text() object, so SQLAlchemy compiles each query once
+    result = session.execute(_text(query), params)
+    # Zip rows with the column names once fetched, instead of going through row._mapping
+    keys = tuple(result.keys())
     if record_id is not None:
-        query = text(f"SELECT * FROM {table_name} WHERE id = :id")
-        result = session.execute(query, {"id": record_id})
         row = result.fetchone()
-        if row:
-            return dict(row._mapping)
-        return None
-
-    # Build query with filters
-    query = f"SELECT * FROM {table_name}"
-    params = {}
-    conditions = []
-    
-    # Add test prefix filter if name column exists
-    if test_prefix:
-        conditions.append("name LIKE :test_prefix")
-        params["test_prefix"] = f"{test_prefix}%"
-    
-    if filters:
-        for key, value in filters.items():
-            conditions.append(f"{key} = :{key}")
-            params[key] = value
-    
-    if conditions:
-        query += " WHERE " + " AND ".join(conditions)
+        return dict(zip(keys, row)) if row else None
+
+    return [dict(zip(keys, row)) for row in result.fetchall()]
+
 
-    result = session.execute(text(query), params)
-    rows = result.fetchall()
-    return [dict(row._mapping) for row in rows] if rows else []
+def iter_database_state(
+    session: Session, table_name: str, test_prefix: str = "test_", batch_size: int = 1000, **filters
+) -> Iterator[Dict[str, Any]]:
+    """Stream matching records instead of loading them all at once.
+
+    Rows are read through a server-side cursor batch_size at a time, so
+    memory stays flat however many rows match.
+
+    Args:
+        session: Database session
+        table_name: Table name to query
+        test_prefix: Prefix for test data filtering
+        batch_size: Rows fetched per round trip
+        **filters: Additional filter criteria
+
+    Yields:
+        Records as dictionaries
+    """
+    query, params = _build_state_query(table_name, None, test_prefix, filters)
+    result = session.execute(_text(query), params, execution_options={"yield_per": batch_size})
+    keys = tuple(result.keys())
+    for row in result:
+        yield dict(zip(keys, row))
+
+
+def verify_database_states(
+    session: Session, table_name: str, record_ids: Sequence[int]
+) -> Dict[int, Dict[str, Any]]:
+    """Query several records by ID in one round trip.
+
+    Args:
+        session: Database session
+        table_name: Table name to query
+        record_ids: Record IDs to query
+
+    Returns:
+        Records as dictionaries keyed by ID; missing IDs are left out
+    """
+    query = _text(f"SELECT * FROM {_check_identifier(table_name)} WHERE id = ANY(:ids)")
+    result = session.execute(query, {"ids": list(record_ids)})
+    keys = tuple(result.keys())
+    return {row.id: dict(zip(keys, row)) for row in result}
+
+
+async def verify_database_state_async(
+    pool: asyncpg.Pool, table_name: str, record_id: Optional[int] = None, test_prefix: str = "test_", **filters
+) -> Optional[Dict[str, Any]] | List[Dict[str, Any]]:
+    """Query database and validate state directly through asyncpg.
+
+    Args:
+        pool: asyncpg pool from get_asyncpg_pool
+        table_name: Table name to query
+        record_id: Optional record ID to query
+        test_prefix: Prefix for test data filtering (used when record_id is None)
+        **filters: Additional filter criteria
+
+    Returns:
+        Record as dictionary or None if not found (when record_id provided),
+        or list of records (when record_id is None)
+    """
+    async with pool.acquire() as conn:
+        if record_id is not None:
+            row = await conn.fetchrow(_table_sql(SQL_VERIFY_BY_ID, table_name), record_id)
+            return dict(row) if row else None
+
+        query, args = _to_positional(*_build_state_query(table_name, None, test_prefix, filters))
+        rows = await conn.fetch(query, *args)
+    return [dict(row) for row in rows]
+
+
+def _cleanup_sql(table_name: str) -> str:
+    """Build the DELETE that removes a table's test data.
+
+    Args:
+        table_name: Table name to clean
+
+    Returns:
+        SQL string using a :prefix bind parameter
+    """
+    return f"DELETE FROM {_check_identifier(table_name)} WHERE name LIKE :prefix ESCAPE '\\'"
 
 
 def cleanup_test_data(
@@ -79,22 +415,66 @@ def cleanup_test_data(
     """
     try:
         # Delete records with test prefix in name field (for products)
-        query = text(f"DELETE FROM {table_name} WHERE name LIKE :prefix")
-        session.execute(query, {"prefix": f"{test_prefix}%"})
+        session.execute(_text(_cleanup_sql(table_name)), {"prefix": _prefix_pattern(test_prefix)})
         session.commit()
     except Exception as e:
         print(f"WARNING: Error cleaning up test data: {e}")
         session.rollback()
 
 
+async def cleanup_test_data_async(
+    pool: asyncpg.Pool, table_name: str, test_prefix: str = "test_"
+) -> None:
+    """Remove test data after examples directly through asyncpg.
+
+    Args:
+        pool: asyncpg pool from get_asyncpg_pool
+        table_name: Table name to clean
+        test_prefix: Prefix to identify test data
+    """
+    try:
+        async with pool.acquire() as conn:
+            await conn.execute(_table_sql(SQL_CLEANUP_BY_PREFIX, table_name), _prefix_pattern(test_prefix))
+    except Exception as e:
+        print(f"WARNING: Error cleaning up test data: {e}")
+
+
+def truncate_test_tables(session: Session, tables: Sequence[str]) -> None:
+    """Empty whole tables and reset their ID sequences in one statement.
+
+    Unlike cleanup_test_data this removes every row, not just test data, so
+    only use it on tables that hold nothing else.
+
+    Args:
+        session: Database session
+        tables: Table names to truncate
+    """
+    names = ", ".join(_check_identifier(table) for table in tables)
+    session.execute(text(f"TRUNCATE TABLE {names} RESTART IDENTITY CASCADE"))
+    session.commit()
+
+
 def cleanup_all_test_data(session: Session, tables: List[str], test_prefix: str = "test_") -> None:
     """Remove test data from multiple tables.
 
+    All tables are cleaned in one transaction with a single commit. Each
+    table's DELETE runs in its own savepoint, so a table that fails to clean
+    is reported and skipped without undoing the others.
+
     Args:
         session: Database session
         tables: List of table names to clean
         test_prefix: Prefix to identify test data
     """
+    params = {"prefix": _prefix_pattern(test_prefix)}
     for table in tables:
-        cleanup_test_data(session, table, test_prefix)
-
+        try:
+            with session.begin_nested():
+                session.execute(_text(_cleanup_sql(table)), params)
+        except Exception as e:
+            print(f"WARNING: Error cleaning up test data in {table}: {e}")
+    try:
+        session.commit()
+    except Exception as e:
+        print(f"WARNING: Error cleaning up test data: {e}")
+        session.rollback()
@@ -1,7 +1,7 @@
 """Test models for integration examples."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
 from pylight.domain.entities.rest_endpoint import RestEndpoint
 
 
@@ -9,12 +9,16 @@ class Product(RestEndpoint):
     """Product model for testing REST, GraphQL, and WebSocket features."""
 
     __tablename__ = "products"
+    __table_args__ = (
+        # Serves the examples' LIKE 'test_%' prefix filters and cleanup on PostgreSQL
+        Index("ix_products_name_pattern", "name", postgresql_ops={"name": "varchar_pattern_ops"}),
+    )
 
     id = Column(Integer, primary_key=True)
-    name = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=False, index=True)
     price = Column(Integer, nullable=False)
     description = Column(String(500), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=False), server_default=func.now(), nullable=False)
 
 
 class User(RestEndpoint):
@@ -23,9 +27,9 @@ class User(RestEndpoint):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True)
-    username = Column(String(50), unique=True, nullable=False)
-    email = Column(String(100), unique=True, nullable=False)
+    username = Column(String(50), unique=True, index=True, nullable=False)
+    email = Column(String(100), unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
     role = Column(String(20), default="user")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=False), server_default=func.now(), nullable=False)
 
@@ -1,14 +1,26 @@
 """Shared utilities for integration examples."""
 
+import hashlib
+import json
 import subprocess
 import time
 import signal
+import socket
 import atexit
 import sys
+import os
+import tempfile
 import requests
+from requests.adapters import HTTPAdapter
 import psycopg2
 import redis
-from typing import Optional
+import msgspec
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import httpx
 
 
 def verify_postgres() -> bool:
@@ -52,6 +64,151 @@ def verify_redis() -> bool:
         return False
 
 
+def create_http_session(pool_connections: int = 10, pool_maxsize: int = 50) -> requests.Session:
+    """Create an HTTP session that keeps connections to the test server alive.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host
+
+    Returns:
+        requests Session sending JSON by default
+    """
+    session = requests.Session()
+    session.mount(
+        "http://",
+        HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0),
+    )
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+# Hashes of GraphQL documents the server has already stored as persisted queries
+_PERSISTED_QUERY_HASHES: set = set()
+
+
+def graphql_query_hash(query: str) -> str:
+    """Compute the persisted-query hash of a GraphQL document.
+
+    Args:
+        query: GraphQL query or mutation string
+
+    Returns:
+        Hex-encoded SHA-256 hash
+    """
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class GraphQLDocument:
+    """GraphQL document with its persisted-query request bodies encoded once."""
+
+    query: str
+    query_hash: str
+    full_body: bytes
+    hash_body: bytes
+
+
+def prepare_graphql(query: str) -> GraphQLDocument:
+    """Hash a constant GraphQL document and pre-encode its request bodies.
+
+    Args:
+        query: GraphQL query or mutation string
+
+    Returns:
+        GraphQLDocument ready for post_graphql
+    """
+    query_hash = graphql_query_hash(query)
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+    return GraphQLDocument(
+        query=query,
+        query_hash=query_hash,
+        full_body=json.dumps({"query": query, "extensions": extensions}).encode(),
+        hash_body=json.dumps({"extensions": extensions}).encode(),
+    )
+
+
+def post_graphql(
+    session: requests.Session, url: str, document: GraphQLDocument, timeout: int = 10
+) -> requests.Response:
+    """Send a GraphQL document as an automatic persisted query.
+
+    The first request registers the full document with the server; later
+    requests for the same hash send only the hash. If the server no longer
+    knows the hash, the full document is sent again.
+
+    Args:
+        session: HTTP session sending JSON content
+        url: GraphQL endpoint URL
+        document: Document from prepare_graphql
+        timeout: Request timeout in seconds
+
+    Returns:
+        HTTP response
+    """
+    if document.query_hash in _PERSISTED_QUERY_HASHES:
+        response = session.post(url, data=document.hash_body, timeout=timeout)
+        if b"PersistedQueryNotFound" not in response.content:
+            return response
+        _PERSISTED_QUERY_HASHES.discard(document.query_hash)
+
+    response = session.post(url, data=document.full_body, timeout=timeout)
+    if response.status_code == 200:
+        _PERSISTED_QUERY_HASHES.add(document.query_hash)
+    return response
+
+
+async def post_graphql_async(
+    client: "httpx.AsyncClient", url: str, document: GraphQLDocument
+) -> "httpx.Response":
+    """Send a GraphQL document as an automatic persisted query with httpx.
+
+    Async counterpart of post_graphql, sharing its record of registered hashes.
+
+    Args:
+        client: httpx async client sending JSON content
+        url: GraphQL endpoint URL
+        document: Document from prepare_graphql
+
+    Returns:
+        HTTP response
+    """
+    if document.query_hash in _PERSISTED_QUERY_HASHES:
+        response = await client.post(url, content=document.hash_body)
+        if b"PersistedQueryNotFound" not in response.content:
+            return response
+        _PERSISTED_QUERY_HASHES.discard(document.query_hash)
+
+    response = await client.post(url, content=document.full_body)
+    if response.status_code == 200:
+        _PERSISTED_QUERY_HASHES.add(document.query_hash)
+    return response
+
+
+class GraphQLResponse(msgspec.Struct):
+    """Top-level fields of a GraphQL response body."""
+
+    data: Optional[dict] = None
+    errors: Optional[list] = None
+    error: Optional[str] = None
+
+
+def decode_graphql(response: "requests.Response | httpx.Response") -> GraphQLResponse:
+    """Decode and validate a GraphQL response body in a single pass.
+
+    Args:
+        response: HTTP response from the GraphQL endpoint
+
+    Returns:
+        Decoded GraphQLResponse
+    """
+    return msgspec.json.decode(response.content, type=GraphQLResponse)
+
+
+# Output file of each server process started by start_server, keyed by PID
+_server_logs: Dict[int, str] = {}
+
+
 def start_server(
     app_module: str, host: str = "127.0.0.1", port: int = 8001
 ) -> Optional[subprocess.Popen]:
@@ -66,35 +223,88 @@ def start_server(
         Server process or None if failed
     """
     try:
-        process = subprocess.Popen(
-            ["python", "-m", "uvicorn", app_module, "--host", host, "--port", str(port)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,  # Combine stderr with stdout
-        )
+        # Nothing reads a PIPE while the examples run, so uvicorn would stall once its
+        # buffer fills; a file keeps the output for print_server_log instead.
+        with tempfile.NamedTemporaryFile(
+            prefix="pylight-server-", suffix=".log", delete=False
+        ) as log_file:
+            process = subprocess.Popen(
+                [
+                    "python", "-m", "uvicorn", app_module, "--host", host, "--port", str(port),
+                    # Local test clients gain nothing from compressed frames
+                    "--ws-per-message-deflate", "false",
+                ],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+        _server_logs[process.pid] = log_file.name
         return process
     except Exception as e:
         print(f"ERROR: Failed to start server: {e}")
         return None
 
 
-def wait_for_server(url: str = "http://127.0.0.1:8001/docs", max_attempts: int = 30) -> bool:
+def print_server_log(process: Optional[subprocess.Popen]) -> None:
+    """Print everything a server process started by start_server has written.
+
+    Args:
+        process: Server process whose output to print
+    """
+    if process is None or process.pid not in _server_logs:
+        return
+
+    log_path = _server_logs[process.pid]
+    try:
+        with open(log_path, encoding="utf-8", errors="replace") as log_file:
+            output = log_file.read()
+    except OSError as e:
+        print(f"WARNING: Could not read server log {log_path}: {e}")
+        return
+    print(f"--- server output ({log_path}) ---")
+    print(output.rstrip() or "(no output)")
+    print("--- end of server output ---")
+
+
+def wait_for_server(
+    url: str = "http://127.0.0.1:8001/docs",
+    timeout: float = 15.0,
+    process: Optional[subprocess.Popen] = None,
+) -> bool:
     """Wait for server to be ready.
 
+    The port is probed with plain TCP connects, backing off from 20 ms to
+    0.5 s between tries. The HTTP request is only sent once something is
+    listening. When the server process is given, waiting stops as soon as it
+    exits, and its output is printed if the server never became ready.
+
     Args:
         url: URL to check
-        max_attempts: Maximum number of attempts
+        timeout: Seconds to wait before giving up
+        process: Server process returned by start_server
 
     Returns:
         True if server is ready, False otherwise
     """
-    for _ in range(max_attempts):
-        try:
-            response = requests.get(url, timeout=2)
-            if response.status_code in [200, 404]:  # 404 is OK, means server is up
-                return True
-        except requests.exceptions.RequestException:
-            pass
-        time.sleep(0.5)
+    parts = urlsplit(url)
+    address = (parts.hostname, parts.port or 80)
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            break
+        with socket.socket() as sock:
+            sock.settimeout(0.1)
+            listening = sock.connect_ex(address) == 0
+        if listening:
+            try:
+                response = requests.get(url, timeout=2)
+                if response.status_code in [200, 404]:  # 404 is OK, means server is up
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
+    print_server_log(process)
     return False
 
 
@@ -117,6 +327,13 @@ def stop_server(process: Optional[subprocess.Popen]) -> None:
     except Exception as e:
         print(f"WARNING: Error stopping server: {e}")
 
+    log_path = _server_logs.pop(process.pid, None)
+    if log_path is not None:
+        try:
+            os.remove(log_path)
+        except OSError:
+            pass
+
 
 def setup_server_cleanup(process: Optional[subprocess.Popen]) -> None:
     """Setup cleanup handlers for server process.
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Build a standalone populate-test-database executable with Nuitka."""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+ENTRY_POINT = REPO_ROOT / "scripts" / "populate_test_database" / "__main__.py"
+
+
+def buildCommand(outputDir: Path) -> list[str]:
+    """Build the Nuitka command line.
+
+    Args:
+        outputDir: Directory for the executable
+
+    Returns:
+        Command line arguments
+    """
+    return [
+        sys.executable,
+        "-m",
+        "nuitka",
+        "--onefile",
+        "--include-package=scripts.populate_test_database",
+        "--output-filename=populate-test-database",
+        f"--output-dir={outputDir}",
+        str(ENTRY_POINT),
+    ]
+
+
+def main() -> None:
+    """Compile the command into a single executable."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output-dir", type=Path, default=REPO_ROOT / "dist")
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("nuitka") is None:
+        sys.exit("Nuitka is not installed. Install it with: pip install nuitka")
+
+    # The package imports itself as scripts.populate_test_database
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    subprocess.run(buildCommand(args.output_dir), cwd=REPO_ROOT, env=env, check=True)
+    print(f"Built {args.output_dir / 'populate-test-database'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,11 +33,22 @@ def main():
         default=int(os.getenv("RECORDS_PER_TABLE", "1000")),
         help="Number of records per table (for tables that use this value)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Rows sent per multi-row INSERT statement"
+    )
     parser.add_argument(
         "--skip-schema",
         action="store_true",
         help="Skip schema creation (assume schema already exists)"
     )
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Empty the tables and reset their ids before generating (with --skip-schema)"
+    )
     
     args = parser.parse_args()
     
@@ -53,7 +64,7 @@ def main():
     
     # Generate test data
     print("\nGenerating test data...")
-    generator = DataGenerator(args.database_url, seed=args.seed)
+    generator = DataGenerator(args.database_url, seed=args.seed, batch_size=args.batch_size)
     
     # Calculate record counts based on requirements
     users = args.records_per_table
@@ -67,7 +78,8 @@ def main():
         categories=categories,
         products=products,
         orders=orders,
-        reviews=reviews
+        reviews=reviews,
+        truncate=args.truncate
     )
     
     print("\n✓ Test data generation complete")
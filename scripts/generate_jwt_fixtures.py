@@ -7,7 +7,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.infrastructure.auth.jwt_manual import JWTEncoder
+from scripts.generate_test_keys import writeFixture
+from src.infrastructure.auth.jwt_manual import HS256Signer, JWTEncoder
 
 
 def generateHS256Token(outputPath: Path) -> None:
@@ -24,7 +25,7 @@ def generateHS256Token(outputPath: Path) -> None:
     }
     secretKey = "test_secret_key_for_hs256"
     token = JWTEncoder.encode(payload, secretKey=secretKey, algorithm="HS256")
-    outputPath.write_text(token)
+    writeFixture(outputPath, token.encode())
     print(f"Generated HS256 token: {outputPath}")
 
 
@@ -43,7 +44,7 @@ def generateRS256Token(outputPath: Path, privateKeyPath: Path) -> None:
     }
     privateKey = privateKeyPath.read_text()
     token = JWTEncoder.encode(payload, key=privateKey, algorithm="RS256")
-    outputPath.write_text(token)
+    writeFixture(outputPath, token.encode())
     print(f"Generated RS256 token: {outputPath}")
 
 
@@ -62,7 +63,7 @@ def generateES256Token(outputPath: Path, privateKeyPath: Path) -> None:
     }
     privateKey = privateKeyPath.read_text()
     token = JWTEncoder.encode(payload, key=privateKey, algorithm="ES256")
-    outputPath.write_text(token)
+    writeFixture(outputPath, token.encode())
     print(f"Generated ES256 token: {outputPath}")
 
 
@@ -73,19 +74,22 @@ def generateInvalidTokens(outputDir: Path) -> None:
         outputDir: Directory to save invalid tokens
     """
     malformedToken = "not.a.valid.jwt.token"
-    (outputDir / "malformed_token.txt").write_text(malformedToken)
+    writeFixture(outputDir / "malformed_token.txt", malformedToken.encode())
+
+    # Both tokens below are signed with the same secret, so key it once
+    signer = HS256Signer("test_secret")
 
     expiredPayload = {
         "sub": "user123",
         "exp": int((datetime.now(timezone.utc) - timedelta(hours=1)).timestamp()),
     }
-    expiredToken = JWTEncoder.encode(expiredPayload, secretKey="test_secret", algorithm="HS256")
-    (outputDir / "expired_token.txt").write_text(expiredToken)
+    expiredToken = JWTEncoder.encode(expiredPayload, key=signer, algorithm="HS256")
+    writeFixture(outputDir / "expired_token.txt", expiredToken.encode())
 
-    validToken = JWTEncoder.encode({"sub": "user123"}, secretKey="test_secret", algorithm="HS256")
+    validToken = JWTEncoder.encode({"sub": "user123"}, key=signer, algorithm="HS256")
     parts = validToken.split(".")
     wrongSignatureToken = f"{parts[0]}.{parts[1]}.wrong_signature"
-    (outputDir / "wrong_signature_token.txt").write_text(wrongSignatureToken)
+    writeFixture(outputDir / "wrong_signature_token.txt", wrongSignatureToken.encode())
 
     print(f"Generated invalid tokens in {outputDir}")
 
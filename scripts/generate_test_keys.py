@@ -1,12 +1,47 @@
 #!/usr/bin/env python3
 """Generate RSA and ECDSA test keys for JWT testing."""
 
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec, rsa
 
 
+def writeFixture(path: Path, data: bytes) -> None:
+    """Write a fixture file atomically.
+
+    Data goes to a temporary file next to the target, which then replaces
+    it. A reader never sees a half-written file. There is no fsync, because
+    a lost fixture is simply regenerated.
+
+    Args:
+        path: Fixture file path
+        data: File contents
+    """
+    fd, tempPath = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "wb") as tempFile:
+        tempFile.write(data)
+    # mkstemp creates the file owner-only; use the usual fixture permissions
+    os.chmod(tempPath, 0o644)
+    os.replace(tempPath, path)
+
+
+def keysExist(outputDir: Path, prefix: str) -> bool:
+    """Check whether a key pair was already generated.
+
+    Args:
+        outputDir: Directory holding the keys
+        prefix: Key file prefix (e.g. "rsa")
+
+    Returns:
+        True if both the private and public key files exist
+    """
+    return all((outputDir / f"{prefix}_{kind}_key.pem").exists() for kind in ("private", "public"))
+
+
 def generateRSAKeys(outputDir: Path) -> None:
     """Generate RSA private and public keys for testing.
 
@@ -29,8 +64,8 @@ def generateRSAKeys(outputDir: Path) -> None:
     privateKeyPath = outputDir / "rsa_private_key.pem"
     publicKeyPath = outputDir / "rsa_public_key.pem"
 
-    privateKeyPath.write_bytes(privatePem)
-    publicKeyPath.write_bytes(publicPem)
+    writeFixture(privateKeyPath, privatePem)
+    writeFixture(publicKeyPath, publicPem)
 
     print(f"Generated RSA keys: {privateKeyPath}, {publicKeyPath}")
 
@@ -57,21 +92,35 @@ def generateECDSAKeys(outputDir: Path) -> None:
     privateKeyPath = outputDir / "ecdsa_private_key.pem"
     publicKeyPath = outputDir / "ecdsa_public_key.pem"
 
-    privateKeyPath.write_bytes(privatePem)
-    publicKeyPath.write_bytes(publicPem)
+    writeFixture(privateKeyPath, privatePem)
+    writeFixture(publicKeyPath, publicPem)
 
     print(f"Generated ECDSA keys: {privateKeyPath}, {publicKeyPath}")
 
 
 def main() -> None:
-    """Generate all test keys."""
+    """Generate all test keys.
+
+    Key pairs already present in the fixtures directory are kept, since RSA
+    generation is slow. Set FORCE_REGEN=1 to regenerate them.
+    """
     fixturesDir = Path(__file__).parent.parent / "tests" / "fixtures" / "jwt"
     fixturesDir.mkdir(parents=True, exist_ok=True)
+    forceRegen = bool(os.getenv("FORCE_REGEN"))
+
+    pending = []
+    for prefix, generate in (("rsa", generateRSAKeys), ("ecdsa", generateECDSAKeys)):
+        if keysExist(fixturesDir, prefix) and not forceRegen:
+            print(f"Keeping existing {prefix.upper()} keys in {fixturesDir}")
+            continue
+        pending.append(generate)
 
-    generateRSAKeys(fixturesDir)
-    generateECDSAKeys(fixturesDir)
+    # The key types are independent, so generate them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for future in [executor.submit(generate, fixturesDir) for generate in pending]:
+            future.result()
 
-    print("All test keys generated successfully")
+    print("All test keys ready")
 
 
 if __name__ == "__main__":
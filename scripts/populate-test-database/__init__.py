@@ -1,3 +0,0 @@
-"""Automated test database population routine for Pylight."""
-
-__version__ = "0.1.0"
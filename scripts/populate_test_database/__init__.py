@@ -0,0 +1,42 @@
+"""Automated test database population routine for Pylight."""
+
+import importlib
+from typing import Any
+
+__version__ = "0.1.0"
+
+# Public names resolved on first access so importing the package (e.g. for
+# the CLI's --help) does not pull in Faker, SQLAlchemy or psycopg2
+_LAZY_ATTRIBUTES = {
+    "DataGenerationConfig": ".config",
+    "DataGenerator": ".data_generator",
+    "SchemaGenerator": ".schema_generator",
+    "run_populate": ".cli",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public attribute from its submodule on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested class or function
+
+    Raises:
+        AttributeError: If the name is not a public attribute of the package
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
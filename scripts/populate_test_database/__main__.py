@@ -0,0 +1,6 @@
+"""Run the populate-test-database command as ``python -m scripts.populate_test_database``."""
+
+from scripts.populate_test_database.cli import populate_test_database
+
+if __name__ == "__main__":
+    populate_test_database()
@@ -0,0 +1,264 @@
+"""CLI command for populating test database."""
+
+import json
+import os
+import sys
+
+import click
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional
+    from json import loads as json_loads
+
+from .config import DEFAULT_TABLES
+from .exceptions import ConnectionError, DataGenerationError, SchemaError
+from .utils import log_error, log_exception, log_success, setup_logging
+
+
+def run_populate(
+    conn_str: str,
+    records_per_table: int = 1000,
+    *,
+    create_schema: bool = False,
+    seed: int | None = None,
+    table_counts: dict[str, int] | None = None,
+    cleanup_on_failure: bool = True,
+    batch_size: int = 1000,
+    bulk_method: str = "copy",
+    use_generate_series: bool = False,
+    unsafe_fast: bool = False,
+    unlogged: bool = False,
+    drop_indexes: bool = False,
+    parallel: int = 1,
+) -> dict[str, int]:
+    """Populate the database without going through Click.
+
+    The ``populate-test-database`` command parses its options and calls this
+    function; test fixtures and other Python callers can call it directly.
+
+    Args:
+        conn_str: PostgreSQL connection string
+        records_per_table: Record count for every default table when
+            table_counts is empty
+        create_schema: Drop and recreate the schema before populating
+        seed: Seed value for reproducibility
+        table_counts: Table-specific record counts
+        cleanup_on_failure: Clean up partial data on failure
+        batch_size: Number of rows generated and sent to the database per batch
+        bulk_method: "copy", "binary" or "insert"
+        use_generate_series: Generate the large tables server-side
+        unsafe_fast: Skip triggers and foreign key checks while loading
+        unlogged: Switch the tables to UNLOGGED while loading them
+        drop_indexes: Drop secondary indexes and constraints while loading
+            and recreate them afterwards
+        parallel: Number of worker processes for independent tables
+
+    Returns:
+        Dictionary mapping table names to generated record counts
+
+    Raises:
+        ConnectionError: If the database connection fails
+        SchemaError: If schema creation fails
+        DataGenerationError: If data generation fails
+    """
+    # Deferred so --help and argument errors skip Faker, SQLAlchemy and psycopg2
+    from .config import DataGenerationConfig
+    from .data_generator import DataGenerator
+    from .schema_generator import SchemaGenerator
+
+    if not table_counts:
+        table_counts = dict.fromkeys(DEFAULT_TABLES, records_per_table)
+
+    if create_schema:
+        log_success("Creating schema...")
+        SchemaGenerator(conn_str).create_schema(drop_existing=True)
+        log_success("Schema created successfully")
+
+    config = DataGenerationConfig(
+        connection_string=conn_str,
+        schema_creation_enabled=False,  # Already created above if requested
+        seed=seed,
+        record_counts=table_counts,
+        cleanup_on_failure=cleanup_on_failure,
+        batch_size=batch_size,
+        bulk_method=bulk_method,
+        use_generate_series=use_generate_series,
+        unsafe_fast=unsafe_fast,
+        unlogged=unlogged,
+        drop_indexes_during_load=drop_indexes,
+        parallel=parallel,
+    )
+    return DataGenerator(config).generate_all()
+
+
+@click.command(name="populate-test-database")
+@click.option(
+    "--connection-string",
+    "-c",
+    default=None,
+    help="PostgreSQL connection string (or use DATABASE_URL env var)",
+)
+@click.option(
+    "--create-schema",
+    "-s",
+    is_flag=True,
+    default=False,
+    help="Create/drop schema before populating",
+)
+@click.option(
+    "--seed",
+    "-S",
+    type=int,
+    default=None,
+    help="Seed value for reproducibility",
+)
+@click.option(
+    "--records-per-table",
+    "-r",
+    type=int,
+    default=1000,
+    help="Default number of records per table",
+)
+@click.option(
+    "--table-counts",
+    "-t",
+    type=str,
+    default=None,
+    help="JSON dict of table-specific record counts (e.g., '{\"users\": 2000, \"products\": 5000}')",
+)
+@click.option(
+    "--cleanup-on-failure",
+    "-C",
+    is_flag=True,
+    default=True,
+    help="Clean up partial data on failure",
+)
+@click.option(
+    "--batch-size",
+    "-b",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="Number of rows generated and sent to the database per batch",
+)
+@click.option(
+    "--bulk-method",
+    type=click.Choice(["copy", "binary", "insert"]),
+    default="copy",
+    help="Load rows with COPY FROM STDIN (text, or binary for numeric-heavy tables) "
+    "or with multi-row INSERT statements",
+)
+@click.option(
+    "--use-generate-series",
+    is_flag=True,
+    default=False,
+    help="Generate orders, order items, payments, shipments and inventory server-side "
+    "with generate_series instead of Faker",
+)
+@click.option(
+    "--unsafe-fast",
+    is_flag=True,
+    default=False,
+    help="Skip triggers and foreign key checks while loading (requires a superuser)",
+)
+@click.option(
+    "--unlogged",
+    is_flag=True,
+    default=False,
+    help="Switch the tables to UNLOGGED while loading them (requires table ownership)",
+)
+@click.option(
+    "--drop-indexes",
+    is_flag=True,
+    default=False,
+    help="Drop secondary indexes and unique/foreign key constraints while loading and "
+    "recreate them afterwards",
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Populate independent tables in up to N worker processes; each table then "
+    "commits on its own",
+)
+@click.option("--verbose", "-v", is_flag=True, default=False, help="Enable verbose output")
+@click.option("--quiet", "-q", is_flag=True, default=False, help="Suppress non-error output")
+def populate_test_database(
+    connection_string: str,
+    create_schema: bool,
+    seed: int,
+    records_per_table: int,
+    table_counts: str,
+    cleanup_on_failure: bool,
+    batch_size: int,
+    bulk_method: str,
+    use_generate_series: bool,
+    unsafe_fast: bool,
+    unlogged: bool,
+    drop_indexes: bool,
+    parallel: int,
+    verbose: bool,
+    quiet: bool,
+) -> None:
+    """Populate PostgreSQL database with realistic test data for Pylight feature testing.
+
+    This command generates an e-commerce schema with 10+ interconnected tables
+    and populates them with realistic test data using Faker.
+    """
+    setup_logging(verbose=verbose, quiet=quiet)
+
+    # Get connection string
+    conn_str = connection_string or os.getenv("DATABASE_URL")
+    if not conn_str:
+        log_error("Connection string required. Use --connection-string or set DATABASE_URL")
+        sys.exit(1)
+
+    # Parse table counts
+    table_counts_dict = {}
+    if table_counts:
+        try:
+            table_counts_dict = json_loads(table_counts)
+        except json.JSONDecodeError:
+            log_error(f"Invalid JSON in --table-counts: {table_counts}")
+            sys.exit(1)
+
+    try:
+        counts = run_populate(
+            conn_str,
+            records_per_table,
+            create_schema=create_schema,
+            seed=seed,
+            table_counts=table_counts_dict,
+            cleanup_on_failure=cleanup_on_failure,
+            batch_size=batch_size,
+            bulk_method=bulk_method,
+            use_generate_series=use_generate_series,
+            unsafe_fast=unsafe_fast,
+            unlogged=unlogged,
+            drop_indexes=drop_indexes,
+            parallel=parallel,
+        )
+
+        # Print summary
+        total = sum(counts.values())
+        log_success(f"Data generation complete: {total} total records")
+        if verbose:
+            for table, count in counts.items():
+                log_success(f"  {table}: {count} records")
+
+    except ConnectionError as e:
+        log_error(f"Database connection failed: {e}")
+        sys.exit(1)
+    except SchemaError as e:
+        log_error(f"Schema operation failed: {e}")
+        sys.exit(1)
+    except DataGenerationError as e:
+        log_error(f"Data generation failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        if verbose:
+            log_exception(f"Unexpected error: {e}")
+        else:
+            log_error(f"Unexpected error: {e}")
+        sys.exit(1)
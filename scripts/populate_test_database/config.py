@@ -4,17 +4,42 @@ import os
 from dataclasses import dataclass, field
 from typing import Optional
 
+# The e-commerce tables, in an order that satisfies their foreign keys
+DEFAULT_TABLES: tuple[str, ...] = (
+    "users",
+    "categories",
+    "products",
+    "addresses",
+    "orders",
+    "order_items",
+    "reviews",
+    "payments",
+    "shipments",
+    "inventory",
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DataGenerationConfig:
     """Configuration for test data generation.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive a variant.
+
     Attributes:
         connection_string: PostgreSQL connection string (or use DATABASE_URL env var)
         schema_creation_enabled: Whether to create/drop schema
         seed: Seed value for reproducibility (optional, or use PYLIGHT_POPULATE_SEED env var)
         record_counts: Record counts per table (table_name -> count)
         cleanup_on_failure: Whether to clean up partial data on failure
+        batch_size: Number of rows generated and sent to the database per batch
+        use_generate_series: Generate formulaic tables server-side with generate_series
+        bulk_method: How rows are loaded, "copy" (COPY FROM STDIN), "binary"
+            (COPY BINARY for numeric-heavy tables, text COPY otherwise) or "insert"
+        unsafe_fast: Skip triggers and foreign key checks during the load
+        unlogged: Switch the tables to UNLOGGED while loading them
+        drop_indexes_during_load: Drop secondary indexes, unique and foreign key
+            constraints before the load and recreate them afterwards
+        parallel: Number of worker processes populating independent tables
     """
 
     connection_string: Optional[str] = None
@@ -22,23 +47,31 @@ class DataGenerationConfig:
     seed: Optional[int] = None
     record_counts: dict[str, int] = field(default_factory=dict)
     cleanup_on_failure: bool = True
+    batch_size: int = 1000
+    use_generate_series: bool = False
+    bulk_method: str = "copy"
+    unsafe_fast: bool = False
+    unlogged: bool = False
+    drop_indexes_during_load: bool = False
+    parallel: int = 1
 
     def __post_init__(self) -> None:
         """Initialize configuration from environment variables if not provided."""
         # Get connection string from environment if not provided
         if self.connection_string is None:
-            self.connection_string = os.getenv("DATABASE_URL")
-            if self.connection_string is None:
+            connection_string = os.getenv("DATABASE_URL")
+            if connection_string is None:
                 raise ValueError(
                     "connection_string must be provided or DATABASE_URL environment variable must be set"
                 )
+            object.__setattr__(self, "connection_string", connection_string)
 
         # Get seed from environment if not provided
         if self.seed is None:
             seed_env = os.getenv("PYLIGHT_POPULATE_SEED")
             if seed_env:
                 try:
-                    self.seed = int(seed_env)
+                    object.__setattr__(self, "seed", int(seed_env))
                 except ValueError:
                     pass  # Ignore invalid seed values
 
@@ -0,0 +1,1710 @@
+"""Data generator for populating test database with realistic data."""
+
+import random
+import struct
+import threading
+from array import array
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import replace
+from datetime import datetime, timedelta
+from itertools import islice
+from queue import Empty, Queue
+from typing import Any, TypeVar
+
+import psycopg2
+from faker import Faker
+from psycopg2.extras import Json, execute_values
+
+from .config import DEFAULT_TABLES, DataGenerationConfig
+from .dependency_resolver import DependencyResolver
+from .exceptions import DataGenerationError
+from .utils import log_progress, log_success
+
+# Server-side INSERT ... SELECT FROM generate_series statements used by
+# --use-generate-series. Only tables whose columns are formulaic are listed;
+# parents with unique or free-text columns keep the Faker path. Foreign keys
+# are picked per row from arrays of existing parent IDs.
+_SERIES_INSERTS: dict[str, str] = {
+    "orders": """
+        WITH parents AS (
+            SELECT
+                (SELECT array_agg(id) FROM users) AS user_ids,
+                (SELECT array_agg(id) FROM addresses) AS address_ids
+        )
+        INSERT INTO orders (user_id, address_id, order_date, status, total_amount)
+        SELECT
+            user_ids[1 + floor(random() * cardinality(user_ids))::int],
+            address_ids[1 + floor(random() * cardinality(address_ids))::int],
+            NOW() - random() * INTERVAL '365 days',
+            (ARRAY['pending', 'processing', 'shipped', 'delivered', 'cancelled'])[
+                1 + floor(random() * 5)::int
+            ],
+            round((10 + random() * 990)::numeric, 2)
+        FROM parents, generate_series(1, %(count)s)
+        WHERE cardinality(user_ids) > 0 AND cardinality(address_ids) > 0
+    """,
+    "order_items": """
+        WITH parents AS (
+            SELECT
+                (SELECT array_agg(id) FROM orders) AS order_ids,
+                array_agg(id ORDER BY id) AS product_ids,
+                array_agg(price ORDER BY id) AS prices
+            FROM products
+        ),
+        picks AS (
+            SELECT
+                order_ids[1 + floor(random() * cardinality(order_ids))::int] AS order_id,
+                1 + floor(random() * cardinality(product_ids))::int AS product_index,
+                1 + floor(random() * 10)::int AS quantity,
+                (0.9 + random() * 0.2)::numeric AS markup
+            FROM parents, generate_series(1, %(count)s)
+            WHERE cardinality(order_ids) > 0 AND cardinality(product_ids) > 0
+        )
+        INSERT INTO order_items (order_id, product_id, quantity, unit_price, subtotal)
+        SELECT
+            order_id,
+            product_ids[product_index],
+            quantity,
+            round(prices[product_index] * markup, 2),
+            quantity * round(prices[product_index] * markup, 2)
+        FROM picks, parents
+    """,
+    "payments": """
+        WITH parents AS (
+            SELECT array_agg(id ORDER BY id) AS order_ids,
+                array_agg(total_amount ORDER BY id) AS totals
+            FROM orders
+        ),
+        picks AS (
+            SELECT
+                1 + floor(random() * cardinality(order_ids))::int AS order_index,
+                (ARRAY['pending', 'completed', 'failed', 'refunded'])[
+                    1 + floor(random() * 4)::int
+                ] AS status
+            FROM parents, generate_series(1, %(count)s)
+            WHERE cardinality(order_ids) > 0
+        )
+        INSERT INTO payments (order_id, payment_method, amount, status, transaction_id, processed_at)
+        SELECT
+            order_ids[order_index],
+            (ARRAY['credit_card', 'debit_card', 'paypal', 'bank_transfer'])[
+                1 + floor(random() * 4)::int
+            ],
+            totals[order_index],
+            status,
+            CASE WHEN random() > 0.1 THEN 'TXN-' || md5(random()::text) END,
+            CASE WHEN status = 'completed' THEN NOW() - random() * INTERVAL '365 days' END
+        FROM picks, parents
+    """,
+    "shipments": """
+        WITH parents AS (
+            SELECT array_agg(id) AS order_ids FROM orders
+        ),
+        picks AS (
+            SELECT
+                order_ids[1 + floor(random() * cardinality(order_ids))::int] AS order_id,
+                (ARRAY['pending', 'in_transit', 'delivered', 'lost'])[
+                    1 + floor(random() * 4)::int
+                ] AS status,
+                NOW() - random() * INTERVAL '365 days' AS shipped_at
+            FROM parents, generate_series(1, %(count)s)
+            WHERE cardinality(order_ids) > 0
+        )
+        INSERT INTO shipments (order_id, carrier, tracking_number, status, shipped_at, delivered_at)
+        SELECT
+            order_id,
+            (ARRAY['ups', 'fedex', 'usps', 'dhl'])[1 + floor(random() * 4)::int],
+            CASE WHEN random() > 0.1 THEN 'TRACK-' || md5(random()::text) END,
+            status,
+            CASE WHEN status IN ('in_transit', 'delivered') THEN shipped_at END,
+            CASE
+                WHEN status = 'delivered'
+                THEN shipped_at + (1 + floor(random() * 7)::int) * INTERVAL '1 day'
+            END
+        FROM picks
+    """,
+    # One row per product, matching the unique product_id constraint
+    "inventory": """
+        INSERT INTO inventory (
+            product_id, quantity_available, quantity_reserved, reorder_level, last_restocked_at
+        )
+        SELECT
+            id,
+            available,
+            floor(random() * (LEAST(100, available) + 1))::int,
+            10 + floor(random() * 41)::int,
+            CASE WHEN random() > 0.3 THEN NOW() - random() * INTERVAL '182 days' END
+        FROM (
+            SELECT id, floor(random() * 1001)::int AS available
+            FROM products
+            ORDER BY random()
+            LIMIT %(count)s
+        ) AS picked
+    """,
+}
+
+# Used by --parallel when the dependency graph cannot be read from the database
+_FALLBACK_LEVELS = [
+    ["categories", "users"],
+    ["addresses", "products"],
+    ["inventory", "orders", "reviews"],
+    ["order_items", "payments", "shipments"],
+]
+
+# Numeric column read along with the ids of parent tables whose children copy it
+_PARENT_AMOUNT_COLUMNS = {"products": "price", "orders": "total_amount"}
+
+# Constraints and indexes dropped by --drop-indexes, with the DDL to restore
+# them. Primary keys stay, since the foreign keys being restored need them.
+_DROPPABLE_CONSTRAINTS_QUERY = """
+    SELECT conrelid::regclass::text, quote_ident(conname), pg_get_constraintdef(oid), contype
+    FROM pg_constraint
+    WHERE conrelid = ANY(%(tables)s::regclass[]) AND contype IN ('f', 'u')
+"""
+_DROPPABLE_INDEXES_QUERY = """
+    SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+    FROM pg_index AS i
+    WHERE i.indrelid = ANY(%(tables)s::regclass[])
+    AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint AS c
+        WHERE c.conindid = i.indexrelid AND c.conrelid = i.indrelid
+        AND c.contype IN ('p', 'u', 'x')
+    )
+"""
+
+# Characters that must be backslash-escaped in COPY text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# COPY BINARY framing: signature, flags and header extension length up front,
+# a field count of -1 as the trailer, and a field length of -1 for NULL
+_BINARY_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_BINARY_COPY_TRAILER = struct.pack("!h", -1)
+_BINARY_NULL = struct.pack("!i", -1)
+
+# Binary timestamps count microseconds from the PostgreSQL epoch
+_PG_EPOCH = datetime(2000, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+T = TypeVar("T")
+
+# Number of generated batches buffered ahead of the inserting thread
+_PREFETCH_DEPTH = 4
+
+# Distinct values Faker generates per pooled text column; rows sample the pool.
+# Columns that identify a person or place (names, phones, street addresses)
+# are not pooled and get a fresh Faker value per row.
+_FAKER_POOL_SIZE = 1000
+
+_ONE_YEAR = timedelta(days=365)
+_HALF_YEAR = timedelta(days=182)
+
+
+def _random_ints(rng: random.Random, low: int, high: int, count: int) -> list[int]:
+    """Draw a column of integers uniformly from [low, high].
+
+    Args:
+        rng: Random number generator
+        low: Smallest value
+        high: Largest value
+        count: Number of values
+
+    Returns:
+        List of integers
+    """
+    return rng.choices(range(low, high + 1), k=count)
+
+
+def _random_floats(rng: random.Random, low: float, high: float, count: int) -> list[float]:
+    """Draw a column of floats uniformly from [low, high).
+
+    Args:
+        rng: Random number generator
+        low: Lower bound
+        high: Upper bound
+        count: Number of values
+
+    Returns:
+        List of floats
+    """
+    span = high - low
+    rand = rng.random
+    return [low + span * rand() for _ in range(count)]
+
+
+def _random_amounts(rng: random.Random, low: float, high: float, count: int) -> list[float]:
+    """Draw a column of monetary amounts rounded to cents.
+
+    Args:
+        rng: Random number generator
+        low: Lower bound
+        high: Upper bound
+        count: Number of values
+
+    Returns:
+        List of amounts
+    """
+    return [round(value, 2) for value in _random_floats(rng, low, high, count)]
+
+
+def _random_flags(rng: random.Random, probability: float, count: int) -> list[bool]:
+    """Draw a column of booleans that are True with the given probability.
+
+    Args:
+        rng: Random number generator
+        probability: Chance of each value being True
+        count: Number of values
+
+    Returns:
+        List of booleans
+    """
+    rand = rng.random
+    return [rand() < probability for _ in range(count)]
+
+
+def _random_datetimes(rng: random.Random, max_age: timedelta, count: int) -> list[datetime]:
+    """Draw a column of datetimes uniformly from the last ``max_age``.
+
+    Args:
+        rng: Random number generator
+        max_age: How far back from now values may fall
+        count: Number of values
+
+    Returns:
+        List of datetimes
+    """
+    now = datetime.now()
+    seconds = range(int(max_age.total_seconds()))
+    return [now - timedelta(seconds=offset) for offset in rng.choices(seconds, k=count)]
+
+
+def _fetch_ids(cur: psycopg2.extensions.cursor, table_name: str) -> array:
+    """Fetch a table's primary keys as a packed int64 column.
+
+    Rows are consumed straight off the cursor, so a large parent table never
+    holds a list of row tuples and a list of boxed ints at the same time.
+
+    Args:
+        cur: Database cursor
+        table_name: Name of the table
+
+    Returns:
+        Array of ids
+    """
+    cur.execute(f"SELECT id FROM {table_name}")
+    return array("q", (row[0] for row in cur))
+
+
+def _serials(cur: psycopg2.extensions.cursor, table_name: str, count: int) -> Iterator[int]:
+    """Number a run's rows past every serial that earlier runs used.
+
+    Serials start after the last value of the table's id sequence. Each run
+    draws at least as many ids as serials, and the sequence never goes back,
+    so loading into an already populated table repeats no unique key.
+
+    Args:
+        cur: Database cursor
+        table_name: Name of the table
+        count: Number of serials
+
+    Returns:
+        Iterator over the serials
+    """
+    cur.execute(
+        "SELECT COALESCE(pg_sequence_last_value(pg_get_serial_sequence(%s, 'id')::regclass), 0)",
+        (table_name,),
+    )
+    start = cur.fetchone()[0]
+    return iter(range(start + 1, start + count + 1))
+
+
+def _fetch_ids_with_amounts(
+    cur: psycopg2.extensions.cursor, table_name: str, amount_column: str
+) -> tuple[array, array]:
+    """Fetch a table's primary keys with one numeric column as parallel arrays.
+
+    Args:
+        cur: Database cursor
+        table_name: Name of the table
+        amount_column: Name of the numeric column
+
+    Returns:
+        Tuple of (ids, amounts) where amounts[i] belongs to ids[i]
+    """
+    cur.execute(f"SELECT id, {amount_column} FROM {table_name}")
+    ids = array("q")
+    amounts = array("d")
+    for row_id, amount in cur:
+        ids.append(row_id)
+        amounts.append(amount)
+    return ids, amounts
+
+
+def _faker_pool(provider: Callable[[], T], count: int) -> list[T]:
+    """Generate a pool of Faker values for a column that rows sample from.
+
+    Faker providers cost far more per call than a draw from a list, so each
+    pooled text column calls its provider at most ``_FAKER_POOL_SIZE`` times
+    and the rows pick from the results. Only use it for columns whose
+    cardinality does not matter to the data, never for identifying ones.
+
+    Args:
+        provider: Zero-argument callable producing one value
+        count: Number of rows the column is for
+
+    Returns:
+        List of generated values
+    """
+    return [provider() for _ in range(min(count, _FAKER_POOL_SIZE))]
+
+
+def _prefetch(items: Iterator[T], depth: int = _PREFETCH_DEPTH) -> Iterator[T]:
+    """Yield items from an iterator that is advanced in a background thread.
+
+    At most ``depth`` items are produced ahead of the consumer. Closing the
+    returned generator stops the producer.
+
+    Args:
+        items: Iterator to consume
+        depth: Maximum number of items buffered ahead
+
+    Returns:
+        Iterator over the same items
+    """
+    queue: Queue = Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                queue.put(item)
+            queue.put(done)
+        except BaseException as e:
+            queue.put(e)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while (item := queue.get()) is not done:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue so it can exit
+        while producer.is_alive():
+            try:
+                queue.get(timeout=0.1)
+            except Empty:
+                pass
+
+
+def _generate_table_in_worker(config: DataGenerationConfig, table_name: str) -> int:
+    """Populate one table in its own connection and transaction.
+
+    Entry point for the worker processes used by ``--parallel``.
+
+    Args:
+        config: Data generation configuration for this table
+        table_name: Name of table to populate
+
+    Returns:
+        Number of records generated
+    """
+    generator = DataGenerator(config)
+    conn = psycopg2.connect(config.connection_string)
+    try:
+        with conn:
+            generator._configure_bulk_load(conn)
+            return generator.generate_table(table_name, conn)
+    finally:
+        conn.close()
+
+
+def _copy_value(value: Any) -> str:
+    """Format a value as a COPY text-format field.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Escaped field text, with \\N for NULL
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Json):
+        value = value.dumps(value.adapted)
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _copy_text_chunk(columns: tuple[str, ...], records: list[dict[str, Any]]) -> str:
+    """Encode records as lines of COPY text format.
+
+    Args:
+        columns: Column names, matching the record keys
+        records: Records to encode
+
+    Returns:
+        Tab-separated lines, one per record
+    """
+    return "".join(
+        "\t".join([_copy_value(record[column]) for column in columns]) + "\n" for record in records
+    )
+
+
+def _binary_int4(value: int) -> bytes:
+    """Encode an integer column value as a COPY BINARY int4 field.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Length-prefixed field bytes
+    """
+    return struct.pack("!ii", 4, value)
+
+
+def _binary_numeric(value: float) -> bytes:
+    """Encode an amount as a COPY BINARY numeric field with two decimal places.
+
+    PostgreSQL's numeric wire format stores the absolute value as base-10000
+    digits with the weight of the first digit, a sign word and the display
+    scale.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Length-prefixed field bytes
+    """
+    cents = round(value * 100)
+    sign = 0x4000 if cents < 0 else 0x0000
+    whole, fraction = divmod(abs(cents), 100)
+
+    digits = []
+    while whole:
+        whole, digit = divmod(whole, 10000)
+        digits.insert(0, digit)
+    weight = len(digits) - 1
+    digits.append(fraction * 100)
+
+    # Leading and trailing zero digits carry no information
+    while digits and digits[0] == 0:
+        digits.pop(0)
+        weight -= 1
+    while digits and digits[-1] == 0:
+        digits.pop()
+    if not digits:
+        weight = 0
+
+    return struct.pack(
+        f"!ihhHH{len(digits)}H", 8 + 2 * len(digits), len(digits), weight, sign, 2, *digits
+    )
+
+
+def _binary_timestamp(value: datetime) -> bytes:
+    """Encode a naive datetime as a COPY BINARY timestamp field.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Length-prefixed field bytes
+    """
+    return struct.pack("!iq", 8, (value - _PG_EPOCH) // _MICROSECOND)
+
+
+def _binary_bool(value: bool) -> bytes:
+    """Encode a boolean column value as a COPY BINARY bool field.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Length-prefixed field bytes
+    """
+    return struct.pack("!i?", 1, value)
+
+
+def _binary_text(value: Any) -> bytes:
+    """Encode a text, varchar or json column value as a COPY BINARY field.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Length-prefixed field bytes
+    """
+    if isinstance(value, Json):
+        value = value.dumps(value.adapted)
+    data = str(value).encode()
+    return struct.pack("!i", len(data)) + data
+
+
+# Per-column encoders for the tables loaded with --bulk-method binary. Binary
+# COPY needs the exact server type of every column, so only these numeric-heavy
+# tables are mapped; the rest fall back to text COPY.
+_BINARY_ENCODERS: dict[str, dict[str, Callable[[Any], bytes]]] = {
+    "products": {
+        "name": _binary_text,
+        "description": _binary_text,
+        "sku": _binary_text,
+        "price": _binary_numeric,
+        "cost": _binary_numeric,
+        "category_id": _binary_int4,
+        "brand": _binary_text,
+        "is_active": _binary_bool,
+        "dimensions": _binary_text,
+    },
+    "order_items": {
+        "order_id": _binary_int4,
+        "product_id": _binary_int4,
+        "quantity": _binary_int4,
+        "unit_price": _binary_numeric,
+        "subtotal": _binary_numeric,
+    },
+    "inventory": {
+        "product_id": _binary_int4,
+        "quantity_available": _binary_int4,
+        "quantity_reserved": _binary_int4,
+        "reorder_level": _binary_int4,
+        "last_restocked_at": _binary_timestamp,
+    },
+}
+
+
+def _copy_binary_chunk(
+    columns: tuple[str, ...],
+    encoders: list[Callable[[Any], bytes]],
+    records: list[dict[str, Any]],
+) -> bytes:
+    """Encode records as COPY BINARY tuples, without the stream header or trailer.
+
+    Args:
+        columns: Column names, matching the record keys
+        encoders: Field encoder for each column
+        records: Records to encode
+
+    Returns:
+        Packed tuples, one per record
+    """
+    field_count = struct.pack("!h", len(columns))
+    parts = []
+    for record in records:
+        parts.append(field_count)
+        for column, encode in zip(columns, encoders):
+            value = record[column]
+            parts.append(_BINARY_NULL if value is None else encode(value))
+    return b"".join(parts)
+
+
+class _CopyStream:
+    """Read-only file object over an iterator of COPY data chunks.
+
+    ``copy_expert`` pulls its input through ``read``, so chunks are produced
+    only as fast as the server consumes them and each is released once read.
+    """
+
+    def __init__(self, chunks: Iterator[str | bytes]) -> None:
+        """Initialize the stream.
+
+        Args:
+            chunks: Iterator of text or bytes chunks, all of one type
+        """
+        self._chunks = chunks
+        self._chunk: str | bytes = ""
+        self._offset = 0
+
+    def read(self, size: int = -1) -> str | bytes:
+        """Read up to ``size`` characters or bytes from the current chunk.
+
+        Args:
+            size: Maximum amount to return, or a negative number for everything
+
+        Returns:
+            The data read, empty at the end of the stream
+        """
+        if size < 0:
+            parts = [part for part in (self._chunk[self._offset :], *self._chunks) if part]
+            self._offset = len(self._chunk)
+            return parts[0][:0].join(parts) if parts else self._chunk[:0]
+        while self._offset >= len(self._chunk):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return self._chunk[:0]
+            self._chunk, self._offset = chunk, 0
+        data = self._chunk[self._offset : self._offset + size]
+        self._offset += len(data)
+        return data
+
+
+class DataGenerator:
+    """Generator for realistic test data using Faker."""
+
+    def __init__(self, config: DataGenerationConfig) -> None:
+        """Initialize data generator.
+
+        Args:
+            config: Data generation configuration
+        """
+        self.config = config
+        self.connection_string = config.connection_string
+
+        # One random stream, seeded once, feeds both Faker and the column draws
+        # so --seed reproduces a run without touching the global random state
+        self.rng = random.Random(config.seed)
+        self.faker = Faker()
+        self.faker.random = self.rng
+
+        self.generated_records: dict[str, int] = {}
+        # Parent id columns, read once per parent table; see _parent_columns
+        self._parent_cache: dict[str, tuple[array, array | None]] = {}
+
+    def generate_all(self) -> dict[str, int]:
+        """Generate data for all tables in dependency order.
+
+        Returns:
+            Dictionary mapping table names to generated record counts
+
+        Raises:
+            DataGenerationError: If data generation fails
+        """
+        if self.config.parallel > 1:
+            return self._generate_parallel()
+
+        # Ids cached by an earlier run may have been rolled back or deleted
+        self._parent_cache.clear()
+        try:
+            with closing(psycopg2.connect(self.connection_string)) as conn:
+                # Start transaction
+                conn.autocommit = False
+
+                try:
+                    table_order = self._resolve_order(conn)
+                    self._configure_bulk_load(conn)
+                    if self.config.unlogged:
+                        self._set_logged(conn, table_order, logged=False)
+                    restore_statements = []
+                    if self.config.drop_indexes_during_load:
+                        restore_statements = self._drop_indexes(conn, table_order)
+                    for table_name in table_order:
+                        count = self.generate_table(table_name, conn)
+                        self.generated_records[table_name] = count
+                    self._execute_all(conn, restore_statements)
+                    if self.config.unlogged:
+                        self._set_logged(conn, table_order, logged=True)
+
+                    # Commit transaction
+                    conn.commit()
+                    log_success(
+                        f"Data generation complete: {sum(self.generated_records.values())} records"
+                    )
+                except Exception as e:
+                    # Rollback on failure
+                    if self.config.cleanup_on_failure:
+                        conn.rollback()
+                        log_success("Transaction rolled back due to error")
+                    raise DataGenerationError(
+                        f"Failed to generate data: {e}",
+                        table_name=getattr(e, "table_name", None),
+                    ) from e
+
+        except psycopg2.Error as e:
+            raise DataGenerationError(f"Database error during data generation: {e}") from e
+
+        return self.generated_records
+
+    def _resolve_order(self, conn: psycopg2.extensions.connection) -> list[str]:
+        """Resolve the dependency order on the connection used for the load.
+
+        Reading the foreign keys on the load connection saves the resolver its
+        own connect and validation round trips.
+
+        Args:
+            conn: Database connection with an open transaction
+
+        Returns:
+            List of table names in dependency order
+        """
+        try:
+            return DependencyResolver(self.connection_string, conn=conn).resolve_order()
+        except Exception:
+            # Fallback to hardcoded order if resolver fails; the rollback clears
+            # an aborted transaction before the load starts
+            conn.rollback()
+            return list(DEFAULT_TABLES)
+
+    def _generate_parallel(self) -> dict[str, int]:
+        """Generate data level by level, populating independent tables concurrently.
+
+        Each table runs in a worker process with its own connection and
+        transaction, so a failure only rolls back the failing table; levels
+        that already finished stay committed.
+
+        Returns:
+            Dictionary mapping table names to generated record counts
+
+        Raises:
+            DataGenerationError: If data generation fails
+        """
+        try:
+            levels = DependencyResolver(self.connection_string).resolve_levels()
+        except Exception:
+            levels = _FALLBACK_LEVELS
+
+        if not (self.config.unlogged or self.config.drop_indexes_during_load):
+            self._populate_levels(levels)
+        else:
+            # Workers commit separately, so the tables are prepared and restored
+            # in transactions of their own, and restored even if a worker fails
+            table_order = [table_name for level in levels for table_name in level]
+            restore_statements: list[str] = []
+
+            def prepare(conn: psycopg2.extensions.connection) -> None:
+                if self.config.unlogged:
+                    self._set_logged(conn, table_order, logged=False)
+                if self.config.drop_indexes_during_load:
+                    restore_statements.extend(self._drop_indexes(conn, table_order))
+
+            def restore(conn: psycopg2.extensions.connection) -> None:
+                self._configure_bulk_load(conn)
+                self._execute_all(conn, restore_statements)
+                if self.config.unlogged:
+                    self._set_logged(conn, table_order, logged=True)
+
+            self._in_own_transaction(prepare)
+            try:
+                self._populate_levels(levels)
+            finally:
+                self._in_own_transaction(restore)
+
+        log_success(f"Data generation complete: {sum(self.generated_records.values())} records")
+        return self.generated_records
+
+    def _populate_levels(self, levels: list[list[str]]) -> None:
+        """Populate dependency levels in order, each level's tables in worker processes.
+
+        Args:
+            levels: Dependency levels, each a list of independent table names
+
+        Raises:
+            DataGenerationError: If a table fails to populate
+        """
+        with ProcessPoolExecutor(max_workers=self.config.parallel) as pool:
+            offset = 0
+            for level in levels:
+                futures = {}
+                for table_name in level:
+                    # Offset the seed per table so each worker draws its own stream
+                    seed = self.config.seed
+                    if seed is not None:
+                        seed += offset
+                    offset += 1
+                    table_config = replace(self.config, seed=seed, parallel=1)
+                    futures[table_name] = pool.submit(
+                        _generate_table_in_worker, table_config, table_name
+                    )
+
+                for table_name, future in futures.items():
+                    try:
+                        self.generated_records[table_name] = future.result()
+                    except Exception as e:
+                        raise DataGenerationError(
+                            f"Failed to generate data: {e}", table_name=table_name
+                        ) from e
+
+    def _set_logged(
+        self, conn: psycopg2.extensions.connection, table_order: list[str], logged: bool
+    ) -> None:
+        """Switch tables between UNLOGGED and LOGGED for ``config.unlogged``.
+
+        Unlogged tables skip the WAL while they are loaded. A logged table may
+        not reference an unlogged one, so tables become unlogged children first
+        and logged again parents first. Making a table logged rewrites it.
+
+        Args:
+            conn: Database connection with an open transaction
+            table_order: Table names in dependency order
+            logged: True to make the tables logged, False to make them unlogged
+        """
+        if logged:
+            statement, tables = "SET LOGGED", table_order
+        else:
+            statement, tables = "SET UNLOGGED", table_order[::-1]
+        with conn.cursor() as cur:
+            for table_name in tables:
+                cur.execute(f"ALTER TABLE {table_name} {statement}")
+
+    def _drop_indexes(
+        self, conn: psycopg2.extensions.connection, table_order: list[str]
+    ) -> list[str]:
+        """Drop the tables' secondary indexes and unique and foreign key constraints.
+
+        Without them every loaded row skips index maintenance and foreign key
+        checks; recreating them afterwards builds each index in one sorted pass
+        and validates each foreign key with one join.
+
+        Args:
+            conn: Database connection with an open transaction
+            table_order: Table names in dependency order
+
+        Returns:
+            Statements recreating what was dropped, in the order to run them
+        """
+        with conn.cursor() as cur:
+            cur.execute(_DROPPABLE_CONSTRAINTS_QUERY, {"tables": table_order})
+            constraints = cur.fetchall()
+            cur.execute(_DROPPABLE_INDEXES_QUERY, {"tables": table_order})
+            indexes = cur.fetchall()
+
+            foreign_keys = [constraint for constraint in constraints if constraint[3] == "f"]
+            unique = [constraint for constraint in constraints if constraint[3] == "u"]
+            # Foreign keys go first, since one may rely on a unique constraint
+            for table_name, name, _, _ in foreign_keys + unique:
+                cur.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT {name}")
+            for index_name, _ in indexes:
+                cur.execute(f"DROP INDEX {index_name}")
+
+        return [
+            *(
+                f"ALTER TABLE {table_name} ADD CONSTRAINT {name} {definition}"
+                for table_name, name, definition, _ in unique
+            ),
+            *(definition for _, definition in indexes),
+            *(
+                f"ALTER TABLE {table_name} ADD CONSTRAINT {name} {definition}"
+                for table_name, name, definition, _ in foreign_keys
+            ),
+        ]
+
+    def _execute_all(self, conn: psycopg2.extensions.connection, statements: list[str]) -> None:
+        """Run statements one after another on a connection.
+
+        Args:
+            conn: Database connection
+            statements: SQL statements without parameters
+        """
+        with conn.cursor() as cur:
+            for statement in statements:
+                cur.execute(statement)
+
+    def _in_own_transaction(self, action: Callable[[psycopg2.extensions.connection], None]) -> None:
+        """Run an action on a new connection and commit it.
+
+        Args:
+            action: Callable receiving the connection
+
+        Raises:
+            DataGenerationError: If the action fails with a database error
+        """
+        try:
+            with closing(psycopg2.connect(self.connection_string)) as conn:
+                with conn:
+                    action(conn)
+        except psycopg2.Error as e:
+            raise DataGenerationError(f"Database error during data generation: {e}") from e
+
+    def _configure_bulk_load(self, conn: psycopg2.extensions.connection) -> None:
+        """Apply transaction-local settings that speed up the bulk load.
+
+        Commits do not wait for the WAL flush, since test data does not need to
+        survive a server crash. With ``config.unsafe_fast`` the session also runs
+        as a replication replica, which skips triggers and foreign key checks
+        (requires a superuser). With ``config.unlogged`` or
+        ``config.drop_indexes_during_load`` index builds may use more memory.
+        All settings end with the transaction.
+
+        Args:
+            conn: Database connection with an open transaction
+        """
+        with conn.cursor() as cur:
+            cur.execute("SET LOCAL synchronous_commit = OFF")
+            if self.config.unsafe_fast:
+                cur.execute("SET LOCAL session_replication_role = replica")
+            if self.config.unlogged or self.config.drop_indexes_during_load:
+                cur.execute("SET LOCAL maintenance_work_mem = '1GB'")
+
+    def generate_table(self, table_name: str, conn: psycopg2.extensions.connection) -> int:
+        """Generate data for a single table.
+
+        Args:
+            table_name: Name of table to populate
+            conn: Database connection
+
+        Returns:
+            Number of records generated
+
+        Raises:
+            DataGenerationError: If generation fails
+        """
+        count = self.config.get_record_count(table_name)
+
+        if count == 0:
+            return 0
+
+        # Uniqueness only matters within a table; drop the previous table's values
+        self.faker.unique.clear()
+
+        if self.config.use_generate_series and table_name in _SERIES_INSERTS:
+            inserted = self._insert_series(table_name, count, conn)
+            log_progress(table_name, inserted, count)
+            return inserted
+
+        method_name = f"generate_{table_name}"
+        if not hasattr(self, method_name):
+            raise DataGenerationError(
+                f"No generator method found for table '{table_name}'",
+                table_name=table_name,
+            )
+
+        generator_method = getattr(self, method_name)
+        inserted = generator_method(count, conn)
+
+        log_progress(table_name, inserted, count)
+        return inserted
+
+    def _parent_columns(
+        self, cur: psycopg2.extensions.cursor, table_name: str
+    ) -> tuple[array, array | None]:
+        """Return a parent table's ids, reading them from the database only once.
+
+        The children of a table share one read of it instead of each scanning
+        it again. Loading rows into a table drops its cached columns.
+
+        Args:
+            cur: Database cursor
+            table_name: Name of the parent table
+
+        Returns:
+            Tuple of (ids, amounts), where amounts holds the table's column from
+            ``_PARENT_AMOUNT_COLUMNS`` in id order, or is None
+        """
+        columns = self._parent_cache.get(table_name)
+        if columns is None:
+            amount_column = _PARENT_AMOUNT_COLUMNS.get(table_name)
+            if amount_column is None:
+                columns = (_fetch_ids(cur, table_name), None)
+            else:
+                columns = _fetch_ids_with_amounts(cur, table_name, amount_column)
+            self._parent_cache[table_name] = columns
+        return columns
+
+    def _parent_ids(self, cur: psycopg2.extensions.cursor, table_name: str) -> array:
+        """Return a parent table's ids, reading them from the database only once.
+
+        Args:
+            cur: Database cursor
+            table_name: Name of the parent table
+
+        Returns:
+            Array of ids
+        """
+        return self._parent_columns(cur, table_name)[0]
+
+    def _insert_series(
+        self, table_name: str, count: int, conn: psycopg2.extensions.connection
+    ) -> int:
+        """Populate a table server-side with INSERT ... SELECT FROM generate_series.
+
+        Args:
+            table_name: Name of table to populate
+            count: Number of records to generate
+            conn: Database connection
+
+        Returns:
+            Number of records inserted
+
+        Raises:
+            DataGenerationError: If the parent tables are empty
+        """
+        self._parent_cache.pop(table_name, None)
+        with conn.cursor() as cur:
+            cur.execute(_SERIES_INSERTS[table_name], {"count": count})
+            inserted = cur.rowcount
+
+        if inserted == 0:
+            raise DataGenerationError(
+                f"No parent rows found. Parent tables must be populated before {table_name}.",
+                table_name=table_name,
+            )
+        return inserted
+
+    def _insert_batches(
+        self,
+        conn: psycopg2.extensions.connection,
+        table_name: str,
+        columns: tuple[str, ...],
+        count: int,
+        make_batch: Callable[[int], list[dict[str, Any]]],
+    ) -> int:
+        """Generate and insert records one batch at a time.
+
+        Batches of ``config.batch_size`` records are built in a background
+        thread while the previous ones are sent to the database, and only a few
+        are held in memory at once. With a COPY bulk method every batch is
+        encoded as it is built and streamed into a single COPY statement for
+        the table; ``insert`` sends multi-row VALUES statements carrying up to
+        ``config.batch_size`` rows each.
+
+        Args:
+            conn: Database connection
+            table_name: Name of table to insert into
+            columns: Column names, matching the record keys
+            count: Number of records to generate
+            make_batch: Callable building a batch of the given size
+
+        Returns:
+            Number of records inserted
+        """
+        self._parent_cache.pop(table_name, None)
+        batch_size = self.config.batch_size
+        batches = (
+            make_batch(min(batch_size, count - start)) for start in range(0, count, batch_size)
+        )
+
+        if self.config.bulk_method == "insert":
+            inserted = 0
+            with conn.cursor() as cur, closing(_prefetch(batches)) as prefetched:
+                for batch in prefetched:
+                    execute_values(
+                        cur,
+                        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s",
+                        batch,
+                        template="(" + ", ".join(f"%({column})s" for column in columns) + ")",
+                        page_size=batch_size,
+                    )
+                    inserted += len(batch)
+            return inserted
+
+        # COPY BINARY for the tables with a binary layout, text COPY otherwise
+        if self.config.bulk_method == "binary" and table_name in _BINARY_ENCODERS:
+            encoders = [_BINARY_ENCODERS[table_name][column] for column in columns]
+            header, trailer = _BINARY_COPY_HEADER, _BINARY_COPY_TRAILER
+            options = " WITH (FORMAT BINARY)"
+
+            def encode(batch: list[dict[str, Any]]) -> bytes:
+                return _copy_binary_chunk(columns, encoders, batch)
+
+        else:
+            header, trailer, options = "", "", ""
+
+            def encode(batch: list[dict[str, Any]]) -> str:
+                return _copy_text_chunk(columns, batch)
+
+        encoded = ((len(batch), encode(batch)) for batch in batches)
+        inserted = 0
+
+        def chunks() -> Iterator[str | bytes]:
+            nonlocal inserted
+            yield header
+            with closing(_prefetch(encoded)) as prefetched:
+                for size, chunk in prefetched:
+                    yield chunk
+                    inserted += size
+            yield trailer
+
+        # Closing the chunk generator stops the prefetch thread if COPY fails
+        with conn.cursor() as cur, closing(chunks()) as stream:
+            cur.copy_expert(
+                f"COPY {table_name} ({', '.join(columns)}) FROM STDIN{options}",
+                _CopyStream(stream),
+            )
+        return inserted
+
+    def generate_users(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate user records.
+
+        Args:
+            count: Number of users to generate
+            conn: Database connection
+
+        Returns:
+            Number of users inserted
+        """
+        # Names and phones identify a user, so they are drawn per row rather than pooled
+        user_name = self.faker.user_name
+        first_name = self.faker.first_name
+        last_name = self.faker.last_name
+        phone_number = self.faker.phone_number
+        email_domains = _faker_pool(self.faker.free_email_domain, count)
+        # A running serial keeps every email unique without Faker's unique proxy
+        with conn.cursor() as cur:
+            serials = _serials(cur, "users", count)
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            return [
+                {
+                    "email": f"{user_name()}.{serial}@{email_domain}",
+                    "first_name": first_name(),
+                    "last_name": last_name(),
+                    "phone": phone_number()[:20],  # Limit to 20 chars
+                }
+                for serial, email_domain in zip(
+                    islice(serials, size), self.rng.choices(email_domains, k=size)
+                )
+            ]
+
+        return self._insert_batches(
+            conn, "users", ("email", "first_name", "last_name", "phone"), count, make_batch
+        )
+
+    def generate_categories(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate category records.
+
+        Args:
+            count: Number of categories to generate
+            conn: Database connection
+
+        Returns:
+            Number of categories inserted
+        """
+        seen_names: set[str] = set()
+
+        word = self.faker.word
+        descriptions = _faker_pool(lambda: self.faker.text(max_nb_chars=500), count)
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            records = []
+            for description in self.rng.choices(descriptions, k=size):
+                # Ensure unique name
+                name = self.faker.unique.word().capitalize() + " " + word().capitalize()
+                if len(name) > 100:
+                    name = name[:100]
+                seen_names.add(name)
+
+                records.append(
+                    {
+                        "name": name,
+                        "description": description,
+                        "parent_category_id": None,  # Will be updated later if needed
+                    }
+                )
+            return records
+
+        inserted = self._insert_batches(
+            conn, "categories", ("name", "description", "parent_category_id"), count, make_batch
+        )
+
+        # Get inserted category IDs
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM categories ORDER BY id")
+            category_ids = array("q", (row[0] for row in cur))
+        self._parent_cache["categories"] = (category_ids, None)
+
+        # Update some categories with parent references (optional)
+        if len(category_ids) > 1:
+            # Update 30% of categories to have a parent among the earlier ones
+            num_with_parent = int(len(category_ids) * 0.3)
+            parent_pairs = [
+                (category_ids[i], category_ids[self.rng.randrange(i)])
+                for i in range(1, min(num_with_parent + 1, len(category_ids)))
+            ]
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    "UPDATE categories SET parent_category_id = v.parent "
+                    "FROM (VALUES %s) AS v(child, parent) WHERE categories.id = v.child",
+                    parent_pairs,
+                    page_size=self.config.batch_size,
+                )
+
+        return inserted
+
+    def generate_products(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate product records.
+
+        Args:
+            count: Number of products to generate
+            conn: Database connection
+
+        Returns:
+            Number of products inserted
+        """
+        # Get category IDs
+        with conn.cursor() as cur:
+            category_ids = self._parent_ids(cur, "categories")
+            serials = _serials(cur, "products", count)
+
+        if not category_ids:
+            raise DataGenerationError(
+                "No categories found. Categories must be generated before products.",
+                table_name="products",
+            )
+
+        names = _faker_pool(lambda: self.faker.catch_phrase()[:200], count)
+        descriptions = _faker_pool(lambda: self.faker.text(max_nb_chars=1000), count)
+        brands = _faker_pool(lambda: self.faker.company()[:100], count)
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            records = []
+            columns = zip(
+                _random_amounts(self.rng, 9.99, 999.99, size),
+                _random_amounts(self.rng, 5.0, 500.0, size),
+                self.rng.choices(category_ids, k=size),
+                _random_flags(self.rng, 0.9, size),
+                _random_amounts(self.rng, 5.0, 50.0, size),
+                _random_amounts(self.rng, 5.0, 50.0, size),
+                _random_amounts(self.rng, 5.0, 50.0, size),
+                islice(serials, size),
+                self.rng.choices(names, k=size),
+                self.rng.choices(descriptions, k=size),
+                self.rng.choices(brands, k=size),
+            )
+            for (
+                price,
+                cost,
+                category_id,
+                is_active,
+                width,
+                height,
+                depth,
+                serial,
+                name,
+                description,
+                brand,
+            ) in columns:
+                records.append(
+                    {
+                        "name": name,
+                        "description": description,
+                        "sku": f"PROD-{serial:010d}",
+                        "price": price,
+                        "cost": cost,
+                        "category_id": category_id,
+                        "brand": brand,
+                        "is_active": is_active,
+                        "dimensions": Json({"width": width, "height": height, "depth": depth}),
+                    }
+                )
+            return records
+
+        return self._insert_batches(
+            conn,
+            "products",
+            (
+                "name",
+                "description",
+                "sku",
+                "price",
+                "cost",
+                "category_id",
+                "brand",
+                "is_active",
+                "dimensions",
+            ),
+            count,
+            make_batch,
+        )
+
+    def generate_addresses(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate address records.
+
+        Args:
+            count: Number of addresses to generate
+            conn: Database connection
+
+        Returns:
+            Number of addresses inserted
+        """
+        # Get user IDs
+        with conn.cursor() as cur:
+            user_ids = self._parent_ids(cur, "users")
+
+        if not user_ids:
+            raise DataGenerationError(
+                "No users found. Users must be generated before addresses.",
+                table_name="addresses",
+            )
+
+        # Street addresses and postal codes identify a place, so they are drawn per row
+        street_address = self.faker.street_address
+        zipcode = self.faker.zipcode
+        cities = _faker_pool(lambda: self.faker.city()[:100], count)
+        states = _faker_pool(lambda: self.faker.state()[:50], count)
+        countries = _faker_pool(lambda: self.faker.country()[:50], count)
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            return [
+                {
+                    "user_id": user_id,
+                    "street_address": street_address()[:200],
+                    "city": city,
+                    "state": state,
+                    "postal_code": zipcode()[:20],
+                    "country": country,
+                    "is_default": is_default,
+                }
+                for user_id, city, state, country, is_default in zip(
+                    self.rng.choices(user_ids, k=size),
+                    self.rng.choices(cities, k=size),
+                    self.rng.choices(states, k=size),
+                    self.rng.choices(countries, k=size),
+                    _random_flags(self.rng, 0.2, size),
+                )
+            ]
+
+        return self._insert_batches(
+            conn,
+            "addresses",
+            (
+                "user_id",
+                "street_address",
+                "city",
+                "state",
+                "postal_code",
+                "country",
+                "is_default",
+            ),
+            count,
+            make_batch,
+        )
+
+    def generate_orders(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate order records.
+
+        Args:
+            count: Number of orders to generate
+            conn: Database connection
+
+        Returns:
+            Number of orders inserted
+        """
+        # Get user and address IDs
+        with conn.cursor() as cur:
+            user_ids = self._parent_ids(cur, "users")
+            address_ids = self._parent_ids(cur, "addresses")
+
+        if not user_ids or not address_ids:
+            raise DataGenerationError(
+                "No users or addresses found. Users and addresses must be generated before orders.",
+                table_name="orders",
+            )
+
+        statuses = ["pending", "processing", "shipped", "delivered", "cancelled"]
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            return [
+                {
+                    "user_id": user_id,
+                    "address_id": address_id,
+                    "order_date": order_date,
+                    "status": status,
+                    "total_amount": total_amount,
+                }
+                for user_id, address_id, order_date, status, total_amount in zip(
+                    self.rng.choices(user_ids, k=size),
+                    self.rng.choices(address_ids, k=size),
+                    _random_datetimes(self.rng, _ONE_YEAR, size),
+                    self.rng.choices(statuses, k=size),
+                    _random_amounts(self.rng, 10.0, 1000.0, size),
+                )
+            ]
+
+        return self._insert_batches(
+            conn,
+            "orders",
+            ("user_id", "address_id", "order_date", "status", "total_amount"),
+            count,
+            make_batch,
+        )
+
+    def generate_order_items(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate order item records.
+
+        Args:
+            count: Number of order items to generate
+            conn: Database connection
+
+        Returns:
+            Number of order items inserted
+        """
+        # Get order and product IDs
+        with conn.cursor() as cur:
+            order_ids = self._parent_ids(cur, "orders")
+            product_ids, product_prices = self._parent_columns(cur, "products")
+
+        if not order_ids or not product_ids:
+            raise DataGenerationError(
+                "No orders or products found. Orders and products must be generated before order_items.",
+                table_name="order_items",
+            )
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            records = []
+            for order_id, product_index, quantity, markup in zip(
+                self.rng.choices(order_ids, k=size),
+                _random_ints(self.rng, 0, len(product_ids) - 1, size),
+                _random_ints(self.rng, 1, 10, size),
+                _random_floats(self.rng, 0.9, 1.1, size),
+            ):
+                product_id = product_ids[product_index]
+                unit_price = round(product_prices[product_index] * markup, 2)
+                subtotal = round(quantity * unit_price, 2)
+
+                records.append(
+                    {
+                        "order_id": order_id,
+                        "product_id": product_id,
+                        "quantity": quantity,
+                        "unit_price": unit_price,
+                        "subtotal": subtotal,
+                    }
+                )
+            return records
+
+        return self._insert_batches(
+            conn,
+            "order_items",
+            ("order_id", "product_id", "quantity", "unit_price", "subtotal"),
+            count,
+            make_batch,
+        )
+
+    def generate_reviews(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate review records.
+
+        Args:
+            count: Number of reviews to generate
+            conn: Database connection
+
+        Returns:
+            Number of reviews inserted
+        """
+        # Get user and product IDs
+        with conn.cursor() as cur:
+            user_ids = self._parent_ids(cur, "users")
+            product_ids = self._parent_ids(cur, "products")
+
+        if not user_ids or not product_ids:
+            raise DataGenerationError(
+                "No users or products found. Users and products must be generated before reviews.",
+                table_name="reviews",
+            )
+
+        titles = _faker_pool(lambda: self.faker.sentence(nb_words=6)[:200], count)
+        comments = _faker_pool(lambda: self.faker.text(max_nb_chars=500), count)
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            return [
+                {
+                    "user_id": user_id,
+                    "product_id": product_id,
+                    "rating": rating,
+                    "title": title,
+                    "comment": comment,
+                }
+                for user_id, product_id, rating, title, comment in zip(
+                    self.rng.choices(user_ids, k=size),
+                    self.rng.choices(product_ids, k=size),
+                    _random_ints(self.rng, 1, 5, size),
+                    self.rng.choices(titles, k=size),
+                    self.rng.choices(comments, k=size),
+                )
+            ]
+
+        return self._insert_batches(
+            conn,
+            "reviews",
+            ("user_id", "product_id", "rating", "title", "comment"),
+            count,
+            make_batch,
+        )
+
+    def generate_payments(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate payment records.
+
+        Args:
+            count: Number of payments to generate
+            conn: Database connection
+
+        Returns:
+            Number of payments inserted
+        """
+        # Get order IDs
+        with conn.cursor() as cur:
+            order_ids, order_amounts = self._parent_columns(cur, "orders")
+            serials = _serials(cur, "payments", count)
+
+        if not order_ids:
+            raise DataGenerationError(
+                "No orders found. Orders must be generated before payments.",
+                table_name="payments",
+            )
+
+        payment_methods = ["credit_card", "debit_card", "paypal", "bank_transfer"]
+        statuses = ["pending", "completed", "failed", "refunded"]
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            records = []
+            for order_index, payment_method, status, has_transaction, date, serial in zip(
+                _random_ints(self.rng, 0, len(order_ids) - 1, size),
+                self.rng.choices(payment_methods, k=size),
+                self.rng.choices(statuses, k=size),
+                _random_flags(self.rng, 0.9, size),  # 90% have transaction ID
+                _random_datetimes(self.rng, _ONE_YEAR, size),
+                islice(serials, size),
+            ):
+                transaction_id = f"TXN-{serial:010d}" if has_transaction else None
+
+                processed_at = date if status == "completed" else None
+
+                records.append(
+                    {
+                        "order_id": order_ids[order_index],
+                        "payment_method": payment_method,
+                        "amount": round(order_amounts[order_index], 2),
+                        "status": status,
+                        "transaction_id": transaction_id,
+                        "processed_at": processed_at,
+                    }
+                )
+            return records
+
+        return self._insert_batches(
+            conn,
+            "payments",
+            (
+                "order_id",
+                "payment_method",
+                "amount",
+                "status",
+                "transaction_id",
+                "processed_at",
+            ),
+            count,
+            make_batch,
+        )
+
+    def generate_shipments(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate shipment records.
+
+        Args:
+            count: Number of shipments to generate
+            conn: Database connection
+
+        Returns:
+            Number of shipments inserted
+        """
+        # Get order IDs
+        with conn.cursor() as cur:
+            order_ids = self._parent_ids(cur, "orders")
+            serials = _serials(cur, "shipments", count)
+
+        if not order_ids:
+            raise DataGenerationError(
+                "No orders found. Orders must be generated before shipments.",
+                table_name="shipments",
+            )
+
+        carriers = ["ups", "fedex", "usps", "dhl"]
+        statuses = ["pending", "in_transit", "delivered", "lost"]
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            records = []
+            for order_id, carrier, status, has_tracking, date, transit_days, serial in zip(
+                self.rng.choices(order_ids, k=size),
+                self.rng.choices(carriers, k=size),
+                self.rng.choices(statuses, k=size),
+                _random_flags(self.rng, 0.9, size),  # 90% have tracking number
+                _random_datetimes(self.rng, _ONE_YEAR, size),
+                _random_ints(self.rng, 1, 7, size),
+                islice(serials, size),
+            ):
+                tracking_number = f"TRACK-{serial:010d}" if has_tracking else None
+
+                shipped_at = None
+                delivered_at = None
+
+                if status in ["in_transit", "delivered"]:
+                    shipped_at = date
+                if status == "delivered":
+                    delivered_at = shipped_at + timedelta(days=transit_days)
+
+                records.append(
+                    {
+                        "order_id": order_id,
+                        "carrier": carrier,
+                        "tracking_number": tracking_number,
+                        "status": status,
+                        "shipped_at": shipped_at,
+                        "delivered_at": delivered_at,
+                    }
+                )
+            return records
+
+        return self._insert_batches(
+            conn,
+            "shipments",
+            ("order_id", "carrier", "tracking_number", "status", "shipped_at", "delivered_at"),
+            count,
+            make_batch,
+        )
+
+    def generate_inventory(self, count: int, conn: psycopg2.extensions.connection) -> int:
+        """Generate inventory records.
+
+        Args:
+            count: Number of inventory records to generate
+            conn: Database connection
+
+        Returns:
+            Number of inventory records inserted
+        """
+        # Get product IDs
+        with conn.cursor() as cur:
+            product_ids = self._parent_ids(cur, "products")
+
+        if not product_ids:
+            raise DataGenerationError(
+                "No products found. Products must be generated before inventory.",
+                table_name="inventory",
+            )
+
+        # Limit to available products (one-to-one relationship)
+        count = min(count, len(product_ids))
+        selected_product_ids = iter(self.rng.sample(product_ids, count))
+
+        def make_batch(size: int) -> list[dict[str, Any]]:
+            records = []
+            for product_id, quantity_available, reorder_level, restocked, date in zip(
+                islice(selected_product_ids, size),
+                _random_ints(self.rng, 0, 1000, size),
+                _random_ints(self.rng, 10, 50, size),
+                _random_flags(self.rng, 0.7, size),  # 70% have restock date
+                _random_datetimes(self.rng, _HALF_YEAR, size),
+            ):
+                quantity_reserved = self.rng.randint(0, min(100, quantity_available))
+                last_restocked_at = date if restocked else None
+
+                records.append(
+                    {
+                        "product_id": product_id,
+                        "quantity_available": quantity_available,
+                        "quantity_reserved": quantity_reserved,
+                        "reorder_level": reorder_level,
+                        "last_restocked_at": last_restocked_at,
+                    }
+                )
+            return records
+
+        return self._insert_batches(
+            conn,
+            "inventory",
+            (
+                "product_id",
+                "quantity_available",
+                "quantity_reserved",
+                "reorder_level",
+                "last_restocked_at",
+            ),
+            count,
+            make_batch,
+        )
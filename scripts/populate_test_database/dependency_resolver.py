@@ -11,16 +11,25 @@ from .exceptions import CircularDependencyError, ConnectionError
 class DependencyResolver:
     """Resolves table dependency order based on foreign key relationships."""
 
-    def __init__(self, connection_string: str) -> None:
+    def __init__(
+        self,
+        connection_string: str,
+        conn: psycopg2.extensions.connection | None = None,
+    ) -> None:
         """Initialize dependency resolver.
 
         Args:
             connection_string: PostgreSQL connection string
+            conn: Open connection to query instead of connecting per call. The
+                caller owns it; the resolver neither commits nor closes it.
 
         Raises:
             ConnectionError: If connection validation fails
         """
         self.connection_string = connection_string
+        self.conn = conn
+        if conn is not None:
+            return
 
         # Validate connection
         try:
@@ -40,34 +49,16 @@ class DependencyResolver:
         graph: dict[str, list[str]] = defaultdict(list)
 
         try:
-            with psycopg2.connect(self.connection_string) as conn:
-                with conn.cursor() as cur:
-                    # Query foreign key relationships
-                    cur.execute(
-                        """
-                        SELECT
-                            tc.table_name AS source_table,
-                            ccu.table_name AS target_table
-                        FROM information_schema.table_constraints AS tc
-                        JOIN information_schema.key_column_usage AS kcu
-                            ON tc.constraint_name = kcu.constraint_name
-                            AND tc.table_schema = kcu.table_schema
-                        JOIN information_schema.constraint_column_usage AS ccu
-                            ON ccu.constraint_name = tc.constraint_name
-                            AND ccu.table_schema = tc.table_schema
-                        WHERE tc.constraint_type = 'FOREIGN KEY'
-                        AND tc.table_schema = 'public'
-                        ORDER BY tc.table_name
-                        """
-                    )
-
-                    for row in cur.fetchall():
-                        source_table = row[0]
-                        target_table = row[1]
-
-                        # Add dependency: source_table depends on target_table
-                        if target_table not in graph[source_table]:
-                            graph[source_table].append(target_table)
+            if self.conn is not None:
+                rows = self._fetch_foreign_keys(self.conn)
+            else:
+                with psycopg2.connect(self.connection_string) as conn:
+                    rows = self._fetch_foreign_keys(conn)
+
+            for source_table, target_table in rows:
+                # Add dependency: source_table depends on target_table
+                if target_table not in graph[source_table]:
+                    graph[source_table].append(target_table)
 
         except psycopg2.Error as e:
             raise ConnectionError(
@@ -77,6 +68,35 @@ class DependencyResolver:
 
         return dict(graph)
 
+    def _fetch_foreign_keys(self, conn: psycopg2.extensions.connection) -> list[tuple[str, str]]:
+        """Query foreign key relationships in the public schema.
+
+        Args:
+            conn: Database connection
+
+        Returns:
+            List of (source_table, target_table) pairs
+        """
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT
+                    tc.table_name AS source_table,
+                    ccu.table_name AS target_table
+                FROM information_schema.table_constraints AS tc
+                JOIN information_schema.key_column_usage AS kcu
+                    ON tc.constraint_name = kcu.constraint_name
+                    AND tc.table_schema = kcu.table_schema
+                JOIN information_schema.constraint_column_usage AS ccu
+                    ON ccu.constraint_name = tc.constraint_name
+                    AND ccu.table_schema = tc.table_schema
+                WHERE tc.constraint_type = 'FOREIGN KEY'
+                AND tc.table_schema = 'public'
+                ORDER BY tc.table_name
+                """
+            )
+            return cur.fetchall()
+
     def resolve_order(self) -> list[str]:
         """Resolve table population order using topological sort.
 
@@ -124,6 +144,40 @@ class DependencyResolver:
 
         return result
 
+    def resolve_levels(self) -> list[list[str]]:
+        """Group tables into levels that can be populated concurrently.
+
+        Every table depends only on tables in earlier levels. Self-references
+        (such as categories.parent_category_id) do not constrain the order.
+
+        Returns:
+            List of levels, each a sorted list of table names
+
+        Raises:
+            CircularDependencyError: If circular dependencies detected
+        """
+        graph = {
+            table: [dep for dep in deps if dep != table]
+            for table, deps in self.build_dependency_graph().items()
+        }
+        remaining = set(graph)
+        for deps in graph.values():
+            remaining.update(deps)
+
+        levels: list[list[str]] = []
+        done: set[str] = set()
+        while remaining:
+            level = sorted(
+                table for table in remaining if all(dep in done for dep in graph.get(table, []))
+            )
+            if not level:
+                raise CircularDependencyError(self._find_cycle(graph, remaining))
+            levels.append(level)
+            done.update(level)
+            remaining.difference_update(level)
+
+        return levels
+
     def _find_cycle(self, graph: dict[str, list[str]], remaining: set[str]) -> list[str]:
         """Find a cycle in the dependency graph.
 
@@ -15,6 +15,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from .config import DEFAULT_TABLES
 from .db_utils import validate_connection
 from .exceptions import ConnectionError, SchemaError
 
@@ -244,19 +245,4 @@ class SchemaGenerator:
         from sqlalchemy import inspect
 
         inspector = inspect(self.engine)
-        tables = inspector.get_table_names()
-
-        expected_tables = [
-            "users",
-            "categories",
-            "products",
-            "addresses",
-            "orders",
-            "order_items",
-            "reviews",
-            "payments",
-            "shipments",
-            "inventory",
-        ]
-
-        return all(table in tables for table in expected_tables)
+        return set(DEFAULT_TABLES).issubset(inspector.get_table_names())
@@ -64,3 +64,12 @@ def log_error(message: str) -> None:
         message: Error message
     """
     logger.error(f"✗ {message}")
+
+
+def log_exception(message: str) -> None:
+    """Log error message with the traceback of the exception being handled.
+
+    Args:
+        message: Error message
+    """
+    logger.exception(f"✗ {message}")
@@ -439,7 +439,10 @@ class YAMLTableConfigLoader:
         """
         from src.application.endpoints.rest_generator import RESTGenerator
         from src.presentation.graphql.router import createGraphQLRoute
-        from src.presentation.websocket.handler import createWebSocketRoute
+        from src.presentation.websocket.handler import (
+            createWebSocketRoute,
+            resolveWebSocketHandlerClass,
+        )
         from src.presentation.docs.graphiql import createGraphiQLRoute
 
         if not hasattr(model, "__subclasscheck__"):
@@ -463,6 +466,8 @@ class YAMLTableConfigLoader:
         if not any(r.path == "/graphiql" for r in app.starletteApp.routes):
             app.starletteApp.routes.append(graphiqlRoute)
 
-        websocketRoute = createWebSocketRoute(model)
+        handlerClass = resolveWebSocketHandlerClass(model)
+        app.websocketHandlers[model] = handlerClass
+        websocketRoute = createWebSocketRoute(model, handlerClass)
         app.starletteApp.routes.append(websocketRoute)
 
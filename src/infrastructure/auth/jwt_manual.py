@@ -15,6 +15,36 @@ from cryptography.exceptions import InvalidSignature
 from src.domain.errors import AuthenticationError
 
 
+class HS256Signer:
+    """HMAC-SHA256 signer that prepares its secret key once.
+
+    Keying an HMAC hashes the padded key into the inner and outer SHA-256
+    states. The keyed object is copied for each message, so signing many
+    tokens with one secret only pays for that once.
+    """
+
+    def __init__(self, secretKey: str) -> None:
+        """Initialize signer.
+
+        Args:
+            secretKey: Secret key for signing
+        """
+        self._keyed = hmac.new(secretKey.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def sign(self, message: str) -> str:
+        """Sign message using HMAC-SHA256.
+
+        Args:
+            message: Message to sign
+
+        Returns:
+            Base64url-encoded signature
+        """
+        mac = self._keyed.copy()
+        mac.update(message.encode("utf-8"))
+        return base64.urlsafe_b64encode(mac.digest()).decode("utf-8").rstrip("=")
+
+
 class JWTEncoder:
     """JWT token encoder supporting HS256, RS256, RS384, RS512, ES256, ES384, ES512 algorithms."""
 
@@ -30,7 +60,7 @@ class JWTEncoder:
         Args:
             payload: JWT claims (username, role, sub, exp, etc.)
             key: Key for signing (new API)
-                - For HS256: Secret key (str)
+                - For HS256: Secret key (str) or HS256Signer
                 - For RS256/RS384/RS512: RSA private key (PEM str, bytes, or cryptography object)
                 - For ES256/ES384/ES512: ECDSA private key (PEM str, bytes, or cryptography object)
             secretKey: Secret key for HS256 (backward compatibility, deprecated - use key)
@@ -59,7 +89,9 @@ class JWTEncoder:
 
         message = f"{headerEncoded}.{payloadEncoded}"
 
-        if algorithm == "HS256":
+        if algorithm == "HS256" and isinstance(key, HS256Signer):
+            signature = key.sign(message)
+        elif algorithm == "HS256":
             if not isinstance(key, str):
                 raise AuthenticationError("HS256 requires secret key (str)")
             signature = JWTEncoder._signHS256(message, key)
@@ -98,11 +130,7 @@ class JWTEncoder:
         Returns:
             Base64url-encoded signature
         """
-        signature = hmac.new(
-            secretKey.encode("utf-8"), message.encode("utf-8"), hashlib.sha256
-        ).digest()
-        encoded = base64.urlsafe_b64encode(signature).decode("utf-8").rstrip("=")
-        return encoded
+        return HS256Signer(secretKey).sign(message)
 
     @staticmethod
     def _loadRSAPrivateKey(key: str | bytes | object) -> rsa.RSAPrivateKey:
@@ -35,6 +35,14 @@ class Cache:
         """
         raise NotImplementedError("Subclasses must implement delete method")
 
+    async def deletePrefix(self, prefix: str) -> None:
+        """Delete all values whose key starts with a prefix.
+
+        Args:
+            prefix: Cache key prefix
+        """
+        raise NotImplementedError("Subclasses must implement deletePrefix method")
+
     async def flush(self) -> None:
         """Flush all cache entries."""
         raise NotImplementedError("Subclasses must implement flush method")
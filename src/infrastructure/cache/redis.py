@@ -50,6 +50,15 @@ class DefaultRedisCache(RedisCache):
         if self.client:
             await self.client.delete(f"{self.prefix}{key}")
 
+    async def deletePrefix(self, prefix: str) -> None:
+        """Delete all values whose key starts with a prefix."""
+        if not self.client:
+            await self.connect()
+        if self.client:
+            keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}{prefix}*")]
+            if keys:
+                await self.client.delete(*keys)
+
     async def flush(self) -> None:
         """Flush all cache entries."""
         if not self.client:
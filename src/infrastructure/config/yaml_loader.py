@@ -24,8 +24,6 @@ class YAMLLoader:
             ConfigurationError: If file cannot be read or parsed
         """
         path = Path(configPath)
-        if not path.exists():
-            raise ConfigurationError(f"Configuration file not found: {configPath}")
 
         try:
             with open(path, "r") as f:
@@ -39,6 +37,8 @@ class YAMLLoader:
                     raise
         except ConfigurationError:
             raise
+        except FileNotFoundError as e:
+            raise ConfigurationError(f"Configuration file not found: {configPath}") from e
         except Exception as e:
             raise ConfigurationError(f"Error reading configuration file: {e}") from e
 
@@ -16,8 +16,15 @@ class WebSocketHandler:
 
     Provides default implementations for all lifecycle methods that can be
     optionally overridden. All methods are async and can perform async operations.
+
+    Attributes:
+        subprotocols: Subprotocols the handler speaks, in order of preference.
+            The first one also offered by the client is accepted, and stored
+            on websocket.state.subprotocol (None if nothing matched).
     """
 
+    subprotocols: tuple[str, ...] = ()
+
     async def on_connect(self, websocket: WebSocket, model: Type[RestEndpoint]) -> None:
         """Handle WebSocket connection establishment.
 
@@ -18,7 +18,8 @@ from src.infrastructure.plugins.registry import PluginRegistry
 from src.presentation.rest.error_handler import handleError
 from src.application.endpoints.rest_generator import RESTGenerator
 from src.presentation.graphql.router import createGraphQLRoute
-from src.presentation.websocket.handler import createWebSocketRoute
+from src.infrastructure.websocket.base import WebSocketHandler
+from src.presentation.websocket.handler import createWebSocketRoute, resolveWebSocketHandlerClass
 from src.presentation.docs.openapi import OpenAPIGenerator
 from src.presentation.docs.graphiql import createGraphiQLRoute
 
@@ -50,6 +51,7 @@ class LightApi:
         self.swaggerVersion = swaggerVersion
         self.swaggerDescription = swaggerDescription
         self.registeredModels: List[Type[RestEndpoint]] = []
+        self.websocketHandlers: Dict[Type[RestEndpoint], Type[WebSocketHandler]] = {}
         self.middleware: List[Any] = []
         self.pluginRegistry = PluginRegistry()
         self.databaseManager: Optional[DatabaseManager] = None
@@ -166,7 +168,9 @@ class LightApi:
         if not any(r.path == "/graphiql" for r in self.starletteApp.routes):
             self.starletteApp.routes.append(graphiqlRoute)
 
-        websocketRoute = createWebSocketRoute(model)
+        handlerClass = resolveWebSocketHandlerClass(model)
+        self.websocketHandlers[model] = handlerClass
+        websocketRoute = createWebSocketRoute(model, handlerClass)
         self.starletteApp.routes.append(websocketRoute)
 
         openapiGenerator = OpenAPIGenerator(
@@ -227,13 +231,30 @@ class LightApi:
         """Initialize all registered plugins."""
         self.pluginRegistry.initialize(self)
 
-    def run(self, host: str = "localhost", port: int = 8000, debug: bool = False) -> None:
+    def run(
+        self,
+        host: str = "localhost",
+        port: int = 8000,
+        debug: bool = False,
+        wsPerMessageDeflate: bool = True,
+        loop: str = "auto",
+    ) -> None:
         """Run the application server.
 
         Args:
             host: Host to bind to
             port: Port to bind to
             debug: Enable debug mode
+            wsPerMessageDeflate: Compress WebSocket frames per client; turning it off
+                saves one compression per subscriber on broadcasts
+            loop: Event loop implementation ("auto" picks uvloop when installed)
         """
-        uvicorn.run(self.starletteApp, host=host, port=port, log_level="debug" if debug else "info")
+        uvicorn.run(
+            self.starletteApp,
+            host=host,
+            port=port,
+            log_level="debug" if debug else "info",
+            ws_per_message_deflate=wsPerMessageDeflate,
+            loop=loop,
+        )
 
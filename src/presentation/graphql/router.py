@@ -1,13 +1,69 @@
 """GraphQL router integration with Starlette."""
 
+import hashlib
+from collections import OrderedDict
 from typing import Any, Optional
 from starlette.routing import Route
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from sqlalchemy import inspect
 
 from src.infrastructure.database.connection import DatabaseManager
 from src.presentation.graphql.queries import resolveQuery
 from src.presentation.graphql.mutations import resolveMutation
+from src.presentation.middleware.cache import CacheMiddleware
+
+# Maximum number of persisted query documents kept per GraphQL route
+PERSISTED_QUERY_CACHE_SIZE = 1000
+
+
+def _resolvePersistedQuery(
+    query: str, extensions: dict, persistedQueries: "OrderedDict[str, str]"
+) -> tuple[str, Optional[JSONResponse]]:
+    """Resolve an Apollo-style automatic persisted query.
+
+    Clients send the full query once together with its SHA-256 hash; later
+    requests may send only the hash and the stored document is used.
+
+    Args:
+        query: Query string from the request body (may be empty)
+        extensions: Extensions object from the request body
+        persistedQueries: Hash to query document store, least recently used first
+
+    Returns:
+        Tuple of (query string, error response or None)
+    """
+    persistedQuery = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+    if not persistedQuery:
+        return query, None
+
+    queryHash = persistedQuery.get("sha256Hash", "")
+    if not query:
+        query = persistedQueries.get(queryHash, "")
+        if not query:
+            return query, JSONResponse(
+                {
+                    "errors": [
+                        {
+                            "message": "PersistedQueryNotFound",
+                            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                        }
+                    ]
+                }
+            )
+        persistedQueries.move_to_end(queryHash)
+        return query, None
+
+    if hashlib.sha256(query.encode()).hexdigest() != queryHash:
+        return query, JSONResponse(
+            {"error": "Provided sha256Hash does not match query"}, status_code=400
+        )
+
+    persistedQueries[queryHash] = query
+    persistedQueries.move_to_end(queryHash)
+    if len(persistedQueries) > PERSISTED_QUERY_CACHE_SIZE:
+        persistedQueries.popitem(last=False)
+    return query, None
 
 
 def createGraphQLRoute(databaseManager: Optional[DatabaseManager] = None, models: list = None) -> Route:
@@ -20,6 +76,17 @@ def createGraphQLRoute(databaseManager: Optional[DatabaseManager] = None, models
     Returns:
         Starlette Route for GraphQL endpoint
     """
+    persistedQueries: "OrderedDict[str, str]" = OrderedDict()
+    # Built on first use, since models may be registered after the route is created
+    cacheMiddlewares: dict[type, Optional[CacheMiddleware]] = {}
+
+    def getCacheMiddleware(model: type) -> Optional[CacheMiddleware]:
+        """Return the route's cache middleware for a model, or None without a caching class."""
+        if model not in cacheMiddlewares:
+            cachingClass = model.getConfiguration().caching_class
+            cacheMiddlewares[model] = CacheMiddleware(cachingClass) if cachingClass else None
+        return cacheMiddlewares[model]
+
     async def graphqlHandler(request: Request) -> JSONResponse:
         """Handle GraphQL requests."""
         if request.method == "GET":
@@ -32,6 +99,12 @@ def createGraphQLRoute(databaseManager: Optional[DatabaseManager] = None, models
 
             operationName = body.get("operationName", "")
 
+            query, errorResponse = _resolvePersistedQuery(
+                query, body.get("extensions") or {}, persistedQueries
+            )
+            if errorResponse is not None:
+                return errorResponse
+
             if not query:
                 return JSONResponse({"error": "Query is required"}, status_code=400)
 
@@ -122,6 +195,18 @@ def createGraphQLRoute(databaseManager: Optional[DatabaseManager] = None, models
                             break
                 
                 if model:
+                    cacheMiddleware = getCacheMiddleware(model)
+                    # Results embed the ids of related rows, which writes to the
+                    # related models would leave stale, so only plain models are cached
+                    if cacheMiddleware and inspect(model).relationships:
+                        cacheMiddleware = None
+                    if cacheMiddleware:
+                        cachedResult = await cacheMiddleware.getCachedGraphQLResult(
+                            request, model.getTableName(), query, queryVariables
+                        )
+                        if cachedResult is not None:
+                            return JSONResponse({"data": {queryName: cachedResult}})
+
                     result = await resolveQuery(
                         queryName,
                         model,
@@ -129,6 +214,10 @@ def createGraphQLRoute(databaseManager: Optional[DatabaseManager] = None, models
                         request=request,
                         **queryVariables
                     )
+                    if cacheMiddleware and not (isinstance(result, dict) and "error" in result):
+                        await cacheMiddleware.setCachedGraphQLResult(
+                            request, model.getTableName(), query, queryVariables, result
+                        )
                     # GraphQL queries should return data in format: {"data": {"products": [...]}}
                     return JSONResponse({"data": {queryName: result}})
                 else:
@@ -225,6 +314,9 @@ def createGraphQLRoute(databaseManager: Optional[DatabaseManager] = None, models
                         databaseManager,
                         **variables
                     )
+                    cacheMiddleware = getCacheMiddleware(model)
+                    if cacheMiddleware:
+                        await cacheMiddleware.invalidateCache(model.getTableName())
                     # GraphQL mutations should return data in format: {"data": {"createProduct": {...}}}
                     # Use the original mutation name as the key
                     return JSONResponse({"data": {mutationName: result}})
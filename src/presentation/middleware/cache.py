@@ -1,13 +1,17 @@
 """Caching middleware."""
 
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+import hashlib
 import json
+import logging
 
 from src.presentation.middleware.base import Middleware
 from src.infrastructure.cache.base import Cache
 
+logger = logging.getLogger(__name__)
+
 
 class CacheMiddleware(Middleware):
     """Middleware for caching responses."""
@@ -29,6 +33,16 @@ class CacheMiddleware(Middleware):
         self.cacheMethods = cacheMethods
         self.ttl = ttl
 
+    @property
+    def cachesGraphQLResults(self) -> bool:
+        """Whether GraphQL query results may be cached with the cache class.
+
+        Cached GraphQL results are only invalidated through Cache.deletePrefix,
+        so cache classes that do not implement it never store them.
+        """
+        deletePrefix = getattr(self.cacheClass, "deletePrefix", Cache.deletePrefix)
+        return self.cacheClass is not None and deletePrefix is not Cache.deletePrefix
+
     def _generateCacheKey(self, request: Request, modelName: str, resourceId: Optional[str] = None) -> str:
         """Generate cache key for request.
 
@@ -113,6 +127,80 @@ class CacheMiddleware(Middleware):
         except Exception:
             pass
 
+    def _generateGraphQLCacheKey(
+        self, request: Request, modelName: str, query: str, variables: Dict[str, Any]
+    ) -> str:
+        """Generate cache key for a GraphQL query.
+
+        Args:
+            request: Starlette request object
+            modelName: Model name
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            Cache key string
+        """
+        # Pagination reads page and limit from the URL, so they are part of the key too
+        document = json.dumps(
+            [query, variables, sorted(request.query_params.items())], sort_keys=True, default=str
+        )
+        return f"{modelName}:graphql:{hashlib.sha256(document.encode()).hexdigest()}"
+
+    async def getCachedGraphQLResult(
+        self, request: Request, modelName: str, query: str, variables: Dict[str, Any]
+    ) -> Optional[Any]:
+        """Get cached GraphQL query result if available.
+
+        Args:
+            request: Starlette request object
+            modelName: Model name
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            Cached result or None
+        """
+        if not self.cachesGraphQLResults:
+            return None
+
+        try:
+            cache = self.cacheClass()
+            cachedValue = await cache.get(
+                self._generateGraphQLCacheKey(request, modelName, query, variables)
+            )
+            if cachedValue:
+                return json.loads(cachedValue) if isinstance(cachedValue, str) else cachedValue
+        except Exception:
+            pass
+
+        return None
+
+    async def setCachedGraphQLResult(
+        self, request: Request, modelName: str, query: str, variables: Dict[str, Any], result: Any
+    ) -> None:
+        """Cache GraphQL query result.
+
+        Args:
+            request: Starlette request object
+            modelName: Model name
+            query: GraphQL query string
+            variables: Query variables
+            result: Resolved query result
+        """
+        if not self.cachesGraphQLResults:
+            return
+
+        try:
+            cache = self.cacheClass()
+            await cache.set(
+                self._generateGraphQLCacheKey(request, modelName, query, variables),
+                json.dumps(result),
+                self.ttl,
+            )
+        except Exception:
+            pass
+
     async def invalidateCache(self, modelName: str, resourceId: Optional[str] = None) -> None:
         """Invalidate cache entries.
 
@@ -133,6 +221,13 @@ class CacheMiddleware(Middleware):
         except Exception:
             pass
 
+        if self.cachesGraphQLResults:
+            try:
+                await self.cacheClass().deletePrefix(f"{modelName}:graphql:")
+            except Exception:
+                # Cached GraphQL results now outlive the write until their TTL expires
+                logger.exception(f"Failed to invalidate cached GraphQL results for {modelName}")
+
     async def process(self, request: Request, response: Optional[Response] = None) -> Optional[Response]:
         """Process caching."""
         return response
@@ -1,6 +1,6 @@
 """REST POST endpoint handler."""
 
-from typing import Any, Optional, Type, Dict, Callable
+from typing import Any, Optional, Type, Dict, Callable, List
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from sqlalchemy import inspect, insert
@@ -107,8 +107,10 @@ def _convert_field_value(value: Any, column_type: str, column_name: str) -> Any:
     return value
 
 
-async def _validate_request_body(request: Request, model: Type[RestEndpoint]) -> Dict[str, Any]:
-    """Validate request body and return parsed JSON."""
+async def _validate_request_body(
+    request: Request, model: Type[RestEndpoint]
+) -> Dict[str, Any] | List[Any]:
+    """Validate request body and return parsed JSON (an object or an array)."""
     try:
         body = await request.json()
     except Exception as e:
@@ -191,6 +193,19 @@ async def _create_instance(
     return instance
 
 
+async def _create_instances(
+    session: Any,
+    model: Type[RestEndpoint],
+    instances_data: List[Dict[str, Any]]
+) -> List[RestEndpoint]:
+    """Create several instances in database with a single INSERT."""
+    stmt = insert(model).returning(model, sort_by_parameter_order=True)
+    result = await session.scalars(stmt, instances_data)
+    instances = list(result)
+    await session.commit()
+    return instances
+
+
 async def _check_authentication(
     request: Request,
     model: Type[RestEndpoint],
@@ -215,6 +230,20 @@ async def _check_authentication(
         raise AuthenticationError("Authentication failed")
 
 
+async def _invalidate_cache(model: Type[RestEndpoint]) -> None:
+    """Invalidate the model's cached responses."""
+    config = model.getConfiguration()
+    if config.caching_class:
+        cache_middleware = CacheMiddleware(config.caching_class)
+        await cache_middleware.invalidateCache(model.getTableName())
+
+
+async def _broadcast(model: Type[RestEndpoint], instance: RestEndpoint, operation: str) -> None:
+    """Broadcast a change to the model's WebSocket subscribers."""
+    websocket_manager = getWebSocketManager()
+    await websocket_manager.broadcast(model.getTableName(), operation, serializeModel(instance))
+
+
 async def _handle_side_effects(
     model: Type[RestEndpoint],
     instance: RestEndpoint,
@@ -222,16 +251,8 @@ async def _handle_side_effects(
     request: Request
 ) -> None:
     """Handle cache invalidation and WebSocket broadcasting."""
-    table_name = model.getTableName()
-    serialized = serializeModel(instance)
-
-    config = model.getConfiguration()
-    if config.caching_class:
-        cache_middleware = CacheMiddleware(config.caching_class)
-        await cache_middleware.invalidateCache(table_name)
-
-    websocket_manager = getWebSocketManager()
-    await websocket_manager.broadcast(table_name, operation, serialized)
+    await _invalidate_cache(model)
+    await _broadcast(model, instance, operation)
 
 
 def postHandler(model: Type[RestEndpoint], databaseManager: Optional[DatabaseManager] = None) -> Any:
@@ -245,14 +266,52 @@ def postHandler(model: Type[RestEndpoint], databaseManager: Optional[DatabaseMan
         Async handler function
     """
 
+    async def _handle_bulk_create(request: Request, body: List[Any]) -> JSONResponse:
+        """Create every object of a JSON array body in one round trip.
+
+        Field errors carry the index of the array element they belong to.
+        """
+        if not body:
+            raise ValidationError("Request body must be an object or a non-empty array of objects")
+
+        instances_data = []
+        field_errors = []
+        for index, item in enumerate(body):
+            if not isinstance(item, dict):
+                raise ValidationError(
+                    f"Array element {index} must be an object, got {type(item).__name__}"
+                )
+            try:
+                instances_data.append(await _validate_and_convert_types(item, model))
+            except ValidationError as e:
+                field_errors.extend({"index": index, **error} for error in e.field_errors)
+
+        if field_errors:
+            raise ValidationError(field_errors=field_errors)
+
+        async with databaseManager.sessionContext() as session:
+            instances = await _create_instances(session, model, instances_data)
+
+        await _invalidate_cache(model)
+        for instance in instances:
+            await _broadcast(model, instance, "create")
+
+        return JSONResponse([serializeModel(instance) for instance in instances], status_code=201)
+
     async def handler(request: Request) -> JSONResponse:
-        """Handle POST requests."""
+        """Handle POST requests.
+
+        A JSON array body creates all of its objects with a single INSERT.
+        """
         if databaseManager is None:
             raise DatabaseError("Database not configured")
 
         await _check_authentication(request, model, "POST")
 
         body = await _validate_request_body(request, model)
+        if isinstance(body, list):
+            return await _handle_bulk_create(request, body)
+
         instance_data = await _validate_and_convert_types(body, model)
 
         async with databaseManager.sessionContext() as session:
@@ -1,7 +1,8 @@
 """WebSocket handler."""
 
+import json
 import logging
-from typing import Any, Dict, Set, Type
+from typing import Any, Dict, Optional, Set, Type
 
 from starlette.routing import WebSocketRoute
 from starlette.websockets import WebSocket
@@ -9,6 +10,12 @@ from starlette.websockets import WebSocket
 from src.domain.entities.rest_endpoint import RestEndpoint
 from src.infrastructure.websocket.base import DefaultWebSocketHandler, WebSocketHandler
 
+try:
+    import ormsgpack
+except ImportError:
+    # Optional: without it msgpack connections get JSON text frames too
+    ormsgpack = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +52,9 @@ class WebSocketManager:
     async def broadcast(self, modelName: str, eventType: str, data: Dict[str, Any]) -> None:
         """Broadcast a message to all connections for a model.
 
+        Connections that negotiated the "msgpack" subprotocol get a binary
+        msgpack frame; all others get a JSON text frame.
+
         Args:
             modelName: Model name
             eventType: Event type (create, update, delete)
@@ -53,16 +63,20 @@ class WebSocketManager:
         if modelName not in self.connections:
             return
 
-        message = {
-            "type": eventType,
-            "model": modelName,
-            "data": data,
-        }
+        payload = {"type": eventType, "model": modelName, "data": data}
+        # Serialize once per wire format and reuse the frame for every connection
+        frames: Dict[str, str | bytes] = {}
 
         disconnected = set()
         for websocket in self.connections[modelName]:
+            wireFormat = _wireFormat(websocket)
+            if wireFormat not in frames:
+                frames[wireFormat] = _encodeFrame(payload, wireFormat)
             try:
-                await websocket.send_json(message)
+                if wireFormat == "msgpack":
+                    await websocket.send_bytes(frames[wireFormat])
+                else:
+                    await websocket.send_text(frames[wireFormat])
             except Exception:
                 disconnected.add(websocket)
 
@@ -70,6 +84,34 @@ class WebSocketManager:
             self.removeConnection(modelName, websocket)
 
 
+def _wireFormat(websocket: WebSocket) -> str:
+    """Pick the broadcast wire format for a connection.
+
+    Args:
+        websocket: WebSocket connection
+
+    Returns:
+        "msgpack" if the connection negotiated it and ormsgpack is installed, else "json"
+    """
+    subprotocol = getattr(websocket.state, "subprotocol", None)
+    return "msgpack" if subprotocol == "msgpack" and ormsgpack is not None else "json"
+
+
+def _encodeFrame(payload: Dict[str, Any], wireFormat: str) -> str | bytes:
+    """Encode a broadcast payload for a wire format.
+
+    Args:
+        payload: Broadcast message
+        wireFormat: "msgpack" or "json"
+
+    Returns:
+        Packed bytes for msgpack, compact JSON text otherwise
+    """
+    if wireFormat == "msgpack":
+        return ormsgpack.packb(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
 _websocketManager = WebSocketManager()
 
 
@@ -116,27 +158,55 @@ async def _handleMessageLoop(
             break
 
 
-def createWebSocketRoute(model: Type[RestEndpoint]) -> WebSocketRoute:
+def _selectSubprotocol(websocket: WebSocket, supported: tuple[str, ...]) -> Optional[str]:
+    """Pick the subprotocol to accept for a connection.
+
+    Args:
+        websocket: Starlette WebSocket connection
+        supported: Subprotocols the handler speaks, in order of preference
+
+    Returns:
+        First supported subprotocol offered by the client, or None
+    """
+    offered = websocket.scope.get("subprotocols", [])
+    return next((subprotocol for subprotocol in supported if subprotocol in offered), None)
+
+
+def resolveWebSocketHandlerClass(model: Type[RestEndpoint]) -> Type[WebSocketHandler]:
+    """Resolve the WebSocket handler class configured for a model.
+
+    Args:
+        model: Model class
+
+    Returns:
+        Configured websocket_class, or DefaultWebSocketHandler if none is set
+    """
+    handlerClass = getattr(model.getConfiguration(), "websocket_class", None)
+    return handlerClass if handlerClass is not None else DefaultWebSocketHandler
+
+
+def createWebSocketRoute(
+    model: Type[RestEndpoint], handlerClass: Optional[Type[WebSocketHandler]] = None
+) -> WebSocketRoute:
     """Create WebSocket route for a model.
 
     Args:
         model: Model class
+        handlerClass: Handler class to instantiate per connection, resolved
+            from the model's Configuration if not given
 
     Returns:
         Starlette WebSocketRoute
     """
     tableName = model.getTableName()
     manager = getWebSocketManager()
-
-    # Get websocket_class from Configuration, use DefaultWebSocketHandler if None
-    config = model.getConfiguration()
-    handler_class: Type[WebSocketHandler] = DefaultWebSocketHandler
-    if hasattr(config, "websocket_class") and config.websocket_class is not None:
-        handler_class = config.websocket_class
+    handler_class = handlerClass or resolveWebSocketHandlerClass(model)
 
     async def websocketHandler(websocket: WebSocket) -> None:
         """Handle WebSocket connections."""
-        await websocket.accept()
+        subprotocol = _selectSubprotocol(websocket, handler_class.subprotocols)
+        await websocket.accept(subprotocol=subprotocol)
+        websocket.state.subprotocol = subprotocol
         logger.info(f"WebSocket connection accepted for {tableName}")
         manager.addConnection(tableName, websocket)
 
@@ -1,14 +1,25 @@
 """Test data generation using Faker for realistic test data."""
 
+import csv
+import io
 import random
 import json
 from faker import Faker
 from faker.providers import BaseProvider
 import psycopg2
-from psycopg2.extras import execute_batch, Json
+from psycopg2.extras import execute_values, Json
 from typing import List, Dict, Any
 from decimal import Decimal
 
+# Rows sent per multi-row INSERT statement
+INSERT_PAGE_SIZE = 1000
+
+# Tables filled by generate_all, in dependency order
+TABLES = (
+    "users", "categories", "products", "addresses", "orders",
+    "order_items", "reviews", "payments", "shipments", "inventory"
+)
+
 
 class ProductProvider(BaseProvider):
     """Custom Faker provider for product-related data."""
@@ -46,8 +57,9 @@ class OrderProvider(BaseProvider):
 class DataGenerator:
     """Generates realistic test data for all tables."""
     
-    def __init__(self, connection_string: str, seed: int = 42):
+    def __init__(self, connection_string: str, seed: int = 42, batch_size: int = INSERT_PAGE_SIZE):
         self.connection_string = connection_string
+        self.batch_size = batch_size
         self.fake = Faker()
         self.fake.add_provider(ProductProvider)
         self.fake.add_provider(OrderProvider)
@@ -68,6 +80,35 @@ class DataGenerator:
         if self.conn:
             self.conn.close()
     
+    def truncate_tables(self) -> None:
+        """Empty all generated tables and reset their ID sequences in one statement."""
+        self.cursor.execute(f"TRUNCATE TABLE {', '.join(TABLES)} RESTART IDENTITY CASCADE")
+    
+    def _insert_rows(self, sql: str, data: List[tuple]) -> None:
+        """Insert rows using multi-row VALUES statements.
+        
+        execute_values sends up to batch_size rows per statement instead
+        of one statement per row.
+        """
+        execute_values(self.cursor, sql, data, page_size=self.batch_size)
+    
+    def _copy_rows(self, table: str, columns: str, data: List[tuple]) -> None:
+        """Load rows with COPY FROM STDIN, streaming them as CSV.
+        
+        Used for the largest tables, where COPY beats even multi-row INSERTs.
+        None values are written as unquoted empty fields, which CSV COPY reads
+        as NULL.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(data)
+        buffer.seek(0)
+        self.cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+    
+    def _fetch_order_totals(self, order_ids: List[int]) -> Dict[int, Decimal]:
+        """Fetch the totals of the given orders in a single query."""
+        self.cursor.execute("SELECT id, total FROM orders WHERE id = ANY(%s)", (order_ids,))
+        return {order_id: Decimal(str(total)) for order_id, total in self.cursor.fetchall()}
+    
     def generate_users(self, count: int = 1000) -> List[int]:
         """Generate users and return list of user IDs."""
         user_ids = []
@@ -86,14 +127,11 @@ class DataGenerator:
                 random.choice([True, False])  # is_active
             ))
         
-        execute_batch(
-            self.cursor,
+        self._insert_rows(
             """INSERT INTO users (username, email, password_hash, first_name, last_name, role, is_active)
-               VALUES (%s, %s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+               VALUES %s""",
+            data
         )
-        self.conn.commit()
         print(f"Generated {count} users")
         return user_ids
     
@@ -128,14 +166,11 @@ class DataGenerator:
                 True
             ))
         
-        execute_batch(
-            self.cursor,
+        self._insert_rows(
             """INSERT INTO categories (name, slug, description, parent_id, image_url, is_active)
-               VALUES (%s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+               VALUES %s""",
+            data
         )
-        self.conn.commit()
         print(f"Generated {count} categories")
         return category_ids
     
@@ -170,14 +205,11 @@ class DataGenerator:
                 True
             ))
         
-        execute_batch(
-            self.cursor,
+        self._insert_rows(
             """INSERT INTO products (name, description, sku, price, cost, category_id, brand, weight, dimensions, is_active)
-               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+               VALUES %s""",
+            data
         )
-        self.conn.commit()
         print(f"Generated {count} products")
         return product_ids
     
@@ -202,14 +234,11 @@ class DataGenerator:
                     random.choice([True, False])  # is_default
                 ))
         
-        execute_batch(
-            self.cursor,
+        self._insert_rows(
             """INSERT INTO addresses (user_id, type, street_address, city, state, postal_code, country, is_default)
-               VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+               VALUES %s""",
+            data
         )
-        self.conn.commit()
         print(f"Generated {len(address_ids)} addresses")
         return address_ids
     
@@ -254,14 +283,11 @@ class DataGenerator:
                 billing_address_id
             ))
         
-        execute_batch(
-            self.cursor,
-            """INSERT INTO orders (user_id, order_number, status, subtotal, tax, shipping_cost, total, shipping_address_id, billing_address_id)
-               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+        self._copy_rows(
+            "orders",
+            "user_id, order_number, status, subtotal, tax, shipping_cost, total, shipping_address_id, billing_address_id",
+            data
         )
-        self.conn.commit()
         print(f"Generated {count} orders")
         return order_ids
     
@@ -275,11 +301,11 @@ class DataGenerator:
         order_item_ids = []
         data = []
         item_id = 1
+        order_totals = self._fetch_order_totals(order_ids)
         
         for order_id in order_ids:
             # Get order total to distribute across items
-            self.cursor.execute("SELECT total FROM orders WHERE id = %s", (order_id,))
-            order_total = Decimal(str(self.cursor.fetchone()[0]))
+            order_total = order_totals[order_id]
             
             num_items = random.randint(1, items_per_order)
             item_total = order_total / Decimal(str(num_items))
@@ -300,14 +326,11 @@ class DataGenerator:
                     total_price
                 ))
         
-        execute_batch(
-            self.cursor,
-            """INSERT INTO order_items (order_id, product_id, quantity, unit_price, total_price)
-               VALUES (%s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+        self._copy_rows(
+            "order_items",
+            "order_id, product_id, quantity, unit_price, total_price",
+            data
         )
-        self.conn.commit()
         print(f"Generated {len(order_item_ids)} order items")
         return order_item_ids
     
@@ -343,14 +366,11 @@ class DataGenerator:
                 random.choice([True, False])  # is_approved
             ))
         
-        execute_batch(
-            self.cursor,
-            """INSERT INTO reviews (product_id, user_id, rating, title, comment, is_verified_purchase, is_approved)
-               VALUES (%s, %s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+        self._copy_rows(
+            "reviews",
+            "product_id, user_id, rating, title, comment, is_verified_purchase, is_approved",
+            data
         )
-        self.conn.commit()
         print(f"Generated {count} reviews")
         return review_ids
     
@@ -362,10 +382,11 @@ class DataGenerator:
         payment_methods = ['credit_card', 'debit_card', 'paypal', 'bank_transfer']
         statuses = ['pending', 'processing', 'completed', 'failed', 'refunded']
         
+        order_totals = self._fetch_order_totals(order_ids)
+        
         for i, order_id in enumerate(order_ids):
             payment_ids.append(i + 1)
-            self.cursor.execute("SELECT total FROM orders WHERE id = %s", (order_id,))
-            amount = Decimal(str(self.cursor.fetchone()[0]))
+            amount = order_totals[order_id]
             
             status = random.choice(statuses)
             processed_at = self.fake.date_time() if status in ['completed', 'failed'] else None
@@ -379,14 +400,11 @@ class DataGenerator:
                 processed_at
             ))
         
-        execute_batch(
-            self.cursor,
+        self._insert_rows(
             """INSERT INTO payments (order_id, payment_method, amount, status, transaction_id, processed_at)
-               VALUES (%s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+               VALUES %s""",
+            data
         )
-        self.conn.commit()
         print(f"Generated {len(payment_ids)} payments")
         return payment_ids
     
@@ -413,14 +431,11 @@ class DataGenerator:
                 delivered_at
             ))
         
-        execute_batch(
-            self.cursor,
+        self._insert_rows(
             """INSERT INTO shipments (order_id, carrier, tracking_number, status, shipped_at, delivered_at)
-               VALUES (%s, %s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+               VALUES %s""",
+            data
         )
-        self.conn.commit()
         print(f"Generated {len(shipment_ids)} shipments")
         return shipment_ids
     
@@ -443,14 +458,11 @@ class DataGenerator:
                 random.randint(10, 50)  # reorder_level
             ))
         
-        execute_batch(
-            self.cursor,
+        self._insert_rows(
             """INSERT INTO inventory (product_id, quantity_available, quantity_reserved, quantity_sold, reorder_level)
-               VALUES (%s, %s, %s, %s, %s)""",
-            data,
-            page_size=100
+               VALUES %s""",
+            data
         )
-        self.conn.commit()
         print(f"Generated {len(inventory_ids)} inventory records")
         return inventory_ids
     
@@ -460,12 +472,20 @@ class DataGenerator:
         categories: int = 50,
         products: int = 1000,
         orders: int = 2000,
-        reviews: int = 3000
+        reviews: int = 3000,
+        truncate: bool = False
     ):
-        """Generate all test data in correct order respecting relationships."""
+        """Generate all test data in correct order respecting relationships.
+        
+        Pass truncate=True when the schema already holds data: generated rows
+        reference each other by IDs starting at 1.
+        """
         self.connect()
         
         try:
+            if truncate:
+                self.truncate_tables()
+            
             # Generate in dependency order
             user_ids = self.generate_users(users)
             category_ids = self.generate_categories(categories)
@@ -478,6 +498,8 @@ class DataGenerator:
             self.generate_shipments(order_ids)
             self.generate_inventory(product_ids)
             
+            # Everything is loaded in one transaction: one commit, and no partial data on failure
+            self.conn.commit()
             print("All test data generated successfully")
         finally:
             self.close()
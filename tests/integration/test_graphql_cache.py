@@ -0,0 +1,165 @@
+"""Integration tests for GraphQL query result caching."""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, insert
+from starlette.testclient import TestClient
+
+from src.domain.entities.rest_endpoint import RestEndpoint
+from src.infrastructure.cache.base import Cache
+from src.presentation.app import LightApi
+
+LIST_QUERY = "query { gadgets { id name } }"
+
+
+class MemoryCache(Cache):
+    """Process-wide in-memory cache, shared by every instance."""
+
+    store: Dict[str, Any] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value from the store."""
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, expirationSeconds: Optional[int] = None) -> None:
+        """Set a value in the store."""
+        self.store[key] = value
+
+    async def delete(self, key: str) -> None:
+        """Delete a value from the store."""
+        self.store.pop(key, None)
+
+    async def deletePrefix(self, prefix: str) -> None:
+        """Delete every value whose key starts with a prefix."""
+        for key in [key for key in self.store if key.startswith(prefix)]:
+            del self.store[key]
+
+    async def flush(self) -> None:
+        """Flush the store."""
+        self.store.clear()
+
+
+class PrefixlessCache(MemoryCache):
+    """In-memory cache that leaves deletePrefix unimplemented."""
+
+    deletePrefix = Cache.deletePrefix
+
+
+class Gadget(RestEndpoint):
+    """Model cached with the in-memory cache."""
+
+    __tablename__ = "gadgets"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+
+    class Configuration(RestEndpoint.Configuration):
+        caching_class = MemoryCache
+
+
+class Gizmo(RestEndpoint):
+    """Model cached with a cache class lacking deletePrefix."""
+
+    __tablename__ = "gizmos"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+
+    class Configuration(RestEndpoint.Configuration):
+        caching_class = PrefixlessCache
+
+
+@pytest.fixture
+def databasePath(tmp_path: Path) -> Path:
+    """Fixture for a SQLite database holding the test tables."""
+    path = tmp_path / "cache.db"
+    engine = create_engine(f"sqlite:///{path}")
+    RestEndpoint.metadata.create_all(engine, tables=[Gadget.__table__, Gizmo.__table__])
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def client(databasePath: Path) -> Iterator[TestClient]:
+    """Fixture for a client talking to an app with both models registered."""
+    MemoryCache.store.clear()
+    app = LightApi(databaseUrl=f"sqlite+aiosqlite:///{databasePath}")
+    app.register(Gadget)
+    app.register(Gizmo)
+    with TestClient(app.starletteApp) as testClient:
+        yield testClient
+    MemoryCache.store.clear()
+
+
+def insertBehindCache(databasePath: Path, table: Any, name: str) -> None:
+    """Insert a row directly, without invalidating any cache entry."""
+    engine = create_engine(f"sqlite:///{databasePath}")
+    with engine.begin() as conn:
+        conn.execute(insert(table).values(name=name))
+    engine.dispose()
+
+
+def gadgetNames(client: TestClient) -> list[str]:
+    """Return the gadget names served by the GraphQL list query."""
+    response = client.post("/graphql", json={"query": LIST_QUERY})
+    assert response.status_code == 200
+    return [gadget["name"] for gadget in response.json()["data"]["gadgets"]]
+
+
+class TestGraphQLCache:
+    """Test suite for caching GraphQL query results."""
+
+    def test_repeated_query_is_served_from_cache(
+        self, client: TestClient, databasePath: Path
+    ) -> None:
+        """Test that a repeated query returns the cached result."""
+        insertBehindCache(databasePath, Gadget.__table__, "first")
+        assert gadgetNames(client) == ["first"]
+
+        insertBehindCache(databasePath, Gadget.__table__, "second")
+
+        assert gadgetNames(client) == ["first"]
+
+    def test_mutation_invalidates_cached_queries(self, client: TestClient) -> None:
+        """Test that a GraphQL mutation drops the model's cached results."""
+        assert gadgetNames(client) == []
+
+        response = client.post(
+            "/graphql",
+            json={"query": "mutation { createGadget { id } }", "variables": {"input": {"name": "new"}}},
+        )
+
+        assert response.status_code == 200
+        assert gadgetNames(client) == ["new"]
+
+    def test_rest_write_invalidates_cached_queries(self, client: TestClient) -> None:
+        """Test that a REST POST drops the model's cached GraphQL results."""
+        assert gadgetNames(client) == []
+
+        response = client.post("/api/gadgets", json={"name": "posted"})
+
+        assert response.status_code == 201
+        assert gadgetNames(client) == ["posted"]
+
+    def test_error_result_is_not_cached(self, client: TestClient, databasePath: Path) -> None:
+        """Test that a query resolving to an error is resolved again next time."""
+        query = {"query": "query { gadget(id: 1) { id name } }"}
+        assert "error" in client.post("/graphql", json=query).json()["data"]["gadget"]
+
+        insertBehindCache(databasePath, Gadget.__table__, "late")
+
+        assert client.post("/graphql", json=query).json()["data"]["gadget"]["name"] == "late"
+
+    def test_cache_without_delete_prefix_is_skipped(
+        self, client: TestClient, databasePath: Path
+    ) -> None:
+        """Test that results are not cached when the cache cannot drop them by prefix."""
+        query = {"query": "query { gizmos { id name } }"}
+        assert client.post("/graphql", json=query).json()["data"]["gizmos"] == []
+
+        insertBehindCache(databasePath, Gizmo.__table__, "fresh")
+
+        assert [g["name"] for g in client.post("/graphql", json=query).json()["data"]["gizmos"]] == ["fresh"]
+        assert not any(":graphql:" in key for key in MemoryCache.store)
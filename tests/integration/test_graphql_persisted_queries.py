@@ -0,0 +1,90 @@
+"""Integration tests for GraphQL automatic persisted queries."""
+
+import hashlib
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, insert
+from starlette.testclient import TestClient
+
+from src.domain.entities.rest_endpoint import RestEndpoint
+from src.presentation.app import LightApi
+
+QUERY = "query { sprockets { id name } }"
+QUERY_HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+class Sprocket(RestEndpoint):
+    """Model queried through persisted queries."""
+
+    __tablename__ = "sprockets"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    """Fixture for a client talking to an app with one stored sprocket."""
+    path = tmp_path / "persisted.db"
+    engine = create_engine(f"sqlite:///{path}")
+    RestEndpoint.metadata.create_all(engine, tables=[Sprocket.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Sprocket.__table__).values(name="stored"))
+    engine.dispose()
+
+    app = LightApi(databaseUrl=f"sqlite+aiosqlite:///{path}")
+    app.register(Sprocket)
+    with TestClient(app.starletteApp) as testClient:
+        yield testClient
+
+
+def persistedQuery(queryHash: str) -> dict:
+    """Build the persisted query extension for a hash."""
+    return {"persistedQuery": {"version": 1, "sha256Hash": queryHash}}
+
+
+class TestPersistedQueries:
+    """Test suite for persisted query handling in the GraphQL route."""
+
+    def test_unknown_hash_returns_not_found(self, client: TestClient) -> None:
+        """Test that a hash-only request for an unknown query asks for the document."""
+        response = client.post("/graphql", json={"extensions": persistedQuery(QUERY_HASH)})
+
+        assert response.status_code == 200
+        assert response.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    def test_mismatched_hash_is_rejected(self, client: TestClient) -> None:
+        """Test that a query sent with the wrong hash is not stored."""
+        response = client.post(
+            "/graphql", json={"query": QUERY, "extensions": persistedQuery("0" * 64)}
+        )
+
+        assert response.status_code == 400
+        response = client.post("/graphql", json={"extensions": persistedQuery("0" * 64)})
+        assert response.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    def test_mismatched_query_keeps_registered_document(self, client: TestClient) -> None:
+        """Test that reusing a registered hash for another query leaves the stored one intact."""
+        client.post("/graphql", json={"query": QUERY, "extensions": persistedQuery(QUERY_HASH)})
+
+        response = client.post(
+            "/graphql",
+            json={"query": "query { sprockets { id } }", "extensions": persistedQuery(QUERY_HASH)},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"error": "Provided sha256Hash does not match query"}
+        response = client.post("/graphql", json={"extensions": persistedQuery(QUERY_HASH)})
+        assert response.json() == {"data": {"sprockets": [{"id": 1, "name": "stored"}]}}
+
+    def test_registered_hash_resolves_to_query(self, client: TestClient) -> None:
+        """Test that a hash-only request runs the previously registered query."""
+        first = client.post("/graphql", json={"query": QUERY, "extensions": persistedQuery(QUERY_HASH)})
+        second = client.post("/graphql", json={"extensions": persistedQuery(QUERY_HASH)})
+
+        assert first.status_code == 200
+        assert first.json() == {"data": {"sprockets": [{"id": 1, "name": "stored"}]}}
+        assert second.status_code == 200
+        assert second.json() == first.json()
@@ -0,0 +1,121 @@
+"""Integration tests for creating several objects with one REST POST."""
+
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, func, select
+from starlette.testclient import TestClient
+
+from src.domain.entities.rest_endpoint import RestEndpoint
+from src.infrastructure.cache.base import Cache
+from src.presentation.app import LightApi
+
+
+class CountingCache(Cache):
+    """Cache that stores nothing and counts deleted keys."""
+
+    deletedKeys: list[str] = []
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Always miss."""
+        return None
+
+    async def set(self, key: str, value: Any, expirationSeconds: Optional[int] = None) -> None:
+        """Drop the value."""
+
+    async def delete(self, key: str) -> None:
+        """Record the deleted key."""
+        self.deletedKeys.append(key)
+
+
+class Widget(RestEndpoint):
+    """Model created in bulk by the tests."""
+
+    __tablename__ = "bulk_widgets"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+    quantity = Column(Integer, nullable=True)
+
+    class Configuration(RestEndpoint.Configuration):
+        caching_class = CountingCache
+
+
+@pytest.fixture
+def databasePath(tmp_path: Path) -> Path:
+    """Fixture for a SQLite database holding the widgets table."""
+    path = tmp_path / "bulk.db"
+    engine = create_engine(f"sqlite:///{path}")
+    RestEndpoint.metadata.create_all(engine, tables=[Widget.__table__])
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def client(databasePath: Path) -> Iterator[TestClient]:
+    """Fixture for a client talking to an app with the widget model registered."""
+    CountingCache.deletedKeys.clear()
+    app = LightApi(databaseUrl=f"sqlite+aiosqlite:///{databasePath}")
+    app.register(Widget)
+    with TestClient(app.starletteApp, raise_server_exceptions=False) as testClient:
+        yield testClient
+
+
+def widgetCount(databasePath: Path) -> int:
+    """Count the stored widgets."""
+    engine = create_engine(f"sqlite:///{databasePath}")
+    with engine.connect() as conn:
+        count = conn.execute(select(func.count()).select_from(Widget.__table__)).scalar_one()
+    engine.dispose()
+    return count
+
+
+class TestBulkCreate:
+    """Test suite for POSTing a JSON array to a model endpoint."""
+
+    def test_array_creates_every_object(self, client: TestClient, databasePath: Path) -> None:
+        """Test that every array element is created and returned in order."""
+        response = client.post(
+            "/api/bulk_widgets", json=[{"name": "a", "quantity": "1"}, {"name": "b"}, {"name": "c"}]
+        )
+
+        assert response.status_code == 201
+        created = response.json()
+        assert [widget["name"] for widget in created] == ["a", "b", "c"]
+        assert created[0]["quantity"] == 1
+        assert len({widget["id"] for widget in created}) == 3
+        assert widgetCount(databasePath) == 3
+
+    def test_array_invalidates_cache_once(self, client: TestClient) -> None:
+        """Test that a bulk create invalidates the model's cache once, not per object."""
+        response = client.post("/api/bulk_widgets", json=[{"name": "a"}, {"name": "b"}])
+
+        assert response.status_code == 201
+        assert CountingCache.deletedKeys == ["bulk_widgets:list"]
+
+    def test_empty_array_is_rejected(self, client: TestClient, databasePath: Path) -> None:
+        """Test that an empty array is a validation error."""
+        response = client.post("/api/bulk_widgets", json=[])
+
+        assert response.status_code == 400
+        assert widgetCount(databasePath) == 0
+
+    def test_non_object_element_is_rejected(self, client: TestClient, databasePath: Path) -> None:
+        """Test that an array element that is not an object names its index."""
+        response = client.post("/api/bulk_widgets", json=[{"name": "a"}, 5])
+
+        assert response.status_code == 400
+        assert "Array element 1" in response.json()["detail"]
+        assert widgetCount(databasePath) == 0
+
+    def test_invalid_element_reports_its_index(self, client: TestClient, databasePath: Path) -> None:
+        """Test that field errors carry the index of the failing element."""
+        response = client.post(
+            "/api/bulk_widgets", json=[{"name": "a"}, {"quantity": 2}, {"name": "c", "quantity": "x"}]
+        )
+
+        assert response.status_code == 400
+        errors = response.json()["errors"]
+        assert {(error["index"], error["field"]) for error in errors} == {(1, "name"), (2, "quantity")}
+        assert widgetCount(databasePath) == 0
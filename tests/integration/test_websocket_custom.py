@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from pathlib import Path
 from typing import Type
 
 import httpx
@@ -338,3 +339,95 @@ class TestCustomWebSocketHandler:
             # Handler methods are called directly, no context manager needed
             response = websocket.receive_json()
             assert response is not None
+
+    def test_register_records_handler_class_per_model(self) -> None:
+        """Test that LightApi.register resolves the handler class once per model."""
+        from sqlalchemy import Column, Integer
+
+        class RegistryProduct(RestEndpoint):
+            __tablename__ = "test_products_registry"
+            id = Column(Integer, primary_key=True)
+
+            class Configuration:
+                websocket_class = CustomTestHandler
+
+        app = LightApi()
+        app.register(RegistryProduct)
+
+        assert app.websocketHandlers == {RegistryProduct: CustomTestHandler}
+        client = TestClient(app.starletteApp)
+        with client.websocket_connect("/ws/test_products_registry") as websocket:
+            assert websocket.receive_json() == {"status": "connected"}
+
+    def test_handler_subprotocol_is_negotiated(self) -> None:
+        """Test that a subprotocol offered by both sides is accepted."""
+        from sqlalchemy import Column, Integer
+        from starlette.applications import Starlette
+
+        class SubprotocolHandler(WebSocketHandler):
+            """Handler that reports the negotiated subprotocol."""
+
+            subprotocols = ("msgpack", "json")
+
+            async def on_connect(self, websocket: WebSocket, model: Type[RestEndpoint]) -> None:
+                """Handle connection - send the accepted subprotocol."""
+                await self.send(websocket, {"subprotocol": websocket.state.subprotocol})
+
+        class SubprotocolProduct(RestEndpoint):
+            __tablename__ = "test_products_subprotocol"
+            id = Column(Integer, primary_key=True)
+
+            class Configuration:
+                websocket_class = SubprotocolHandler
+
+        client = TestClient(Starlette(routes=[createWebSocketRoute(SubprotocolProduct)]))
+        path = "/ws/test_products_subprotocol"
+
+        with client.websocket_connect(path, subprotocols=["json", "msgpack"]) as websocket:
+            assert websocket.accepted_subprotocol == "msgpack"
+            assert websocket.receive_json() == {"subprotocol": "msgpack"}
+
+        with client.websocket_connect(path) as websocket:
+            assert websocket.accepted_subprotocol is None
+            assert websocket.receive_json() == {"subprotocol": None}
+
+    def test_broadcast_uses_msgpack_subprotocol(self, tmp_path: Path) -> None:
+        """Test that REST broadcasts reach msgpack connections as binary frames."""
+        ormsgpack = pytest.importorskip("ormsgpack")
+        from sqlalchemy import Column, Integer, String, create_engine
+
+        class MsgpackHandler(WebSocketHandler):
+            """Handler that speaks msgpack."""
+
+            subprotocols = ("msgpack",)
+
+        class MsgpackProduct(RestEndpoint):
+            __tablename__ = "test_products_msgpack"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+            class Configuration(RestEndpoint.Configuration):
+                websocket_class = MsgpackHandler
+
+        databasePath = tmp_path / "broadcast.db"
+        engine = create_engine(f"sqlite:///{databasePath}")
+        RestEndpoint.metadata.create_all(engine, tables=[MsgpackProduct.__table__])
+        engine.dispose()
+
+        app = LightApi(databaseUrl=f"sqlite+aiosqlite:///{databasePath}")
+        app.register(MsgpackProduct)
+        path = "/ws/test_products_msgpack"
+
+        with TestClient(app.starletteApp) as client:
+            with client.websocket_connect(path, subprotocols=["msgpack"]) as msgpackSocket:
+                with client.websocket_connect(path) as jsonSocket:
+                    response = client.post("/api/test_products_msgpack", json={"name": "packed"})
+                    assert response.status_code == 201
+
+                    expected = {
+                        "type": "create",
+                        "model": "test_products_msgpack",
+                        "data": response.json(),
+                    }
+                    assert ormsgpack.unpackb(msgpackSocket.receive_bytes()) == expected
+                    assert json.loads(jsonSocket.receive_text()) == expected
@@ -2,6 +2,7 @@
 
 import pytest
 
+from scripts.populate_test_database.cli import run_populate
 from scripts.populate_test_database.config import DataGenerationConfig
 from scripts.populate_test_database.data_generator import DataGenerator
 from scripts.populate_test_database.schema_generator import SchemaGenerator
@@ -61,3 +62,19 @@ def test_docker_postgres_integration(test_connection_string):
 
     except Exception as e:
         pytest.skip(f"PostgreSQL not available for integration testing: {e}")
+
+
+def test_run_populate_without_click(test_connection_string):
+    """Test populating through the plain function used by fixtures."""
+    try:
+        counts = run_populate(
+            test_connection_string,
+            create_schema=True,
+            seed=42,
+            table_counts={"users": 5, "categories": 3},
+        )
+    except Exception as e:
+        pytest.skip(f"PostgreSQL not available for integration testing: {e}")
+
+    assert counts["users"] == 5
+    assert counts["categories"] == 3
@@ -0,0 +1,87 @@
+"""Command dispatch checks for the Pylight CLI."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+
+def runCli(*args: str) -> subprocess.CompletedProcess:
+    """Run the CLI in a subprocess without DATABASE_URL set.
+
+    Args:
+        *args: Arguments passed to the CLI
+
+    Returns:
+        Completed process with captured output
+    """
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    return subprocess.run(
+        [sys.executable, "-m", "cli", *args],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+    )
+
+
+class TestPopulateTestDatabaseCommand:
+    """Tests for dispatching the click-based populate-test-database command."""
+
+    def test_help_is_shown(self) -> None:
+        """Test that the command's own help is printed."""
+        result = runCli("populate-test-database", "--help")
+
+        assert result.returncode == 0
+        assert "Usage: populate-test-database" in result.stdout
+        assert "--records-per-table" in result.stdout
+
+    def test_command_runs(self) -> None:
+        """Test that the command body runs and reports the missing connection string."""
+        result = runCli("populate-test-database")
+
+        assert result.returncode == 1
+        assert "Connection string required" in result.stdout + result.stderr
+
+
+class TestMigrateArguments:
+    """Tests for parsing the migrate command's positional arguments."""
+
+    def parse(self, *args: str) -> dict:
+        """Parse migrate arguments with the parser the CLI group builds.
+
+        Args:
+            *args: Arguments following "migrate"
+
+        Returns:
+            Parsed values keyed by destination name
+        """
+        from cli.__main__ import pylight
+        from cli.commands.migrate import migrateCommand
+
+        return vars(pylight._buildParser(migrateCommand).parse_args(list(args)))
+
+    def test_arguments_keep_declaration_order(self) -> None:
+        """Test that the action comes before the migration name."""
+        assert self.parse("create", "add_users") == {
+            "action": "create",
+            "name": "add_users",
+            "database_url": None,
+        }
+
+    def test_name_is_optional(self) -> None:
+        """Test that actions without a name parse on their own."""
+        assert self.parse("upgrade", "--database-url", "postgresql://db") == {
+            "action": "upgrade",
+            "name": None,
+            "database_url": "postgresql://db",
+        }
+
+    def test_cli_reaches_the_command(self) -> None:
+        """Test that `migrate create NAME` parses and runs the command body."""
+        result = runCli("migrate", "create", "add_users")
+
+        assert result.returncode == 0
+        assert "--database-url required" in result.stderr
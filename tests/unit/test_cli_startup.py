@@ -0,0 +1,54 @@
+"""Startup import checks for the Pylight CLI."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# Heavy modules that must only be imported by the commands that need them
+FORBIDDEN_MODULES = (
+    "sqlalchemy",
+    "starlette",
+    "src.presentation.app",
+    "src.infrastructure.database",
+)
+
+
+def importedModules(*args: str) -> set[str]:
+    """Run the CLI under -X importtime and collect the modules it imported.
+
+    Args:
+        *args: Arguments passed to the CLI
+
+    Returns:
+        Set of imported module names
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "cli", *args],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+class TestCliStartup:
+    """Tests for CLI startup imports."""
+
+    @pytest.mark.parametrize("args", [("--help",), ("--version",)])
+    def test_cli_fast_path_skips_heavy_imports(self, args: tuple[str, ...]) -> None:
+        """Test that --help and --version do not import framework modules."""
+        modules = importedModules(*args)
+
+        assert "cli.click_compat" in modules
+        for forbidden in FORBIDDEN_MODULES:
+            leaked = sorted(m for m in modules if m == forbidden or m.startswith(f"{forbidden}."))
+            assert not leaked, f"{forbidden} imported on CLI startup: {leaked}"
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from src.domain.errors import AuthenticationError
-from src.infrastructure.auth.jwt_manual import JWTDecoder, JWTEncoder
+from src.infrastructure.auth.jwt_manual import HS256Signer, JWTDecoder, JWTEncoder
 
 
 @pytest.fixture
@@ -69,6 +69,14 @@ class TestJWTEncoder:
         assert parts[1]  # Payload
         assert parts[2]  # Signature
 
+    def test_jwt_encode_hs256_signer_matches_secret_key(self, secretKey: str, samplePayload: dict) -> None:
+        """Test a reused HS256Signer produces the same tokens as the secret key."""
+        signer = HS256Signer(secretKey)
+
+        for _ in range(2):
+            token = JWTEncoder.encode(samplePayload, key=signer, algorithm="HS256")
+            assert token == JWTEncoder.encode(samplePayload, secretKey=secretKey, algorithm="HS256")
+
     def test_jwt_encode_rs256_returns_valid_token(
         self, rsaPrivateKey: str, samplePayload: dict
     ) -> None: